@@ -6,13 +6,15 @@
 from __future__ import annotations
 
 import re
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager
 from enum import Enum, auto
 from typing import (
     Any,
     Callable,
+    Final,
     Generator,
     Generic,
     ParamSpec,
@@ -38,6 +40,7 @@ from rkojob.values import (
     ValueProvider,
     ValueRef,
     Values,
+    is_value_provider,
 )
 
 
@@ -149,6 +152,13 @@ class JobStatusCollector:
         pass
 
     def add_listener(self, status_listener: JobStatus) -> None:
+        """
+        Add a listener that is notified of status events.
+
+        Listeners with a false ``detail_enabled`` attribute are not notified of detail messages.
+
+        :param status_listener: The listener to add.
+        """
         self.start_scope.add_callback(status_listener.start_scope)
         self.finish_scope.add_callback(status_listener.finish_scope)
         self.skip_scope.add_callback(status_listener.skip_scope)
@@ -157,7 +167,8 @@ class JobStatusCollector:
         self.start_item.add_callback(status_listener.start_item)
         self.finish_item.add_callback(status_listener.finish_item)
         self.info.add_callback(status_listener.info)
-        self.detail.add_callback(status_listener.detail)
+        if getattr(status_listener, "detail_enabled", True):
+            self.detail.add_callback(status_listener.detail)
         self.error.add_callback(status_listener.error)
         self.warning.add_callback(status_listener.warning)
         self.output.add_callback(status_listener.output)
@@ -222,6 +233,13 @@ class JobStatusCollector:
     @delegate
     def detail(self, detail: str) -> None: ...
 
+    @property
+    def detail_enabled(self) -> bool:
+        """
+        Whether any listener is notified of detail messages. Check before formatting an expensive detail message.
+        """
+        return bool(self.detail)
+
     @delegate
     def error(self, error: Exception | str) -> None: ...
 
@@ -250,8 +268,7 @@ class JobContext(Protocol):
     raised during execution.
     """
 
-    @contextmanager
-    def in_scope(self, scope: JobScope) -> Generator[JobScope, None, None]: ...
+    def in_scope(self, scope: JobScope) -> AbstractContextManager[JobScope]: ...
 
     """
     Push *scope* onto the stack for the duration of the ``with`` block.
@@ -281,6 +298,7 @@ class JobContext(Protocol):
     """
 
     def get_errors(self, scope: JobScopeID | None = None) -> list[Exception]: ...
+
     @property
     def values(self) -> Values: ...
     @property
@@ -298,8 +316,10 @@ class JobContext(Protocol):
 def create_scope_id() -> str:
     """
     Creates a new, unique scope ID value.
+
+    The value is interned so that dictionaries keyed by scope ID compare by identity.
     """
-    return str(uuid4())
+    return sys.intern(str(uuid4()))
 
 
 @runtime_checkable
@@ -308,6 +328,9 @@ class JobScopeID(Protocol):
     Provides a unique ID for a scope.
     """
 
+    # Allows implementations to use __slots__.
+    __slots__ = ()
+
     @property
     def id(self) -> str: ...
 
@@ -436,7 +459,7 @@ def resolve_value(
             raise NoValueError("Unable to resolve value without context.")
         return default
 
-    if isinstance(value, ValueProvider):
+    if is_value_provider(value):
         if raise_no_value or value.has_value:
             return value.get()
         return default
@@ -454,6 +477,9 @@ def resolve_value(
 def resolve_values(
     values: Iterable[JobResolvableValue[Any]], *, context: JobContext | None = None, raise_no_value: bool = True
 ) -> list[Any]:
+    if not values:
+        # Nothing to resolve (e.g. an action without arguments).
+        return []
     return [resolve_value(value, context=context, raise_no_value=raise_no_value) for value in values]
 
 
@@ -465,6 +491,8 @@ def resolve_map(
 ) -> dict[Any, Any]:
     if values is None:
         values = kwargs
+    if not values:
+        return {}
     return {key: resolve_value(value, context=context, raise_no_value=raise_no_value) for key, value in values.items()}
 
 
@@ -668,22 +696,37 @@ job_never = _JobScopeCondition(lambda _: False, "Never")
 """Scope condition that always returns ``False``."""
 
 
-job_failing = _JobScopeCondition(lambda context: bool(context.get_errors()), "Job has failures.")
+def context_has_errors(context: JobContext, scope: JobScopeID | None = None) -> bool:
+    """
+    Return whether any exceptions were recorded for *scope* or for *any* scope if omitted. Uses the context's
+    ``has_errors()``, which avoids building the list of exceptions, when the context provides one and falls back to
+    ``get_errors()`` otherwise.
+
+    :param context: The job context.
+    :param scope: The scope to check, or ``None`` for all scopes.
+    """
+    has_errors: Callable[[JobScopeID | None], bool] | None = getattr(context, "has_errors", None)
+    if has_errors is None:
+        return bool(context.get_errors(scope))
+    return has_errors(scope)
+
+
+job_failing = _JobScopeCondition(lambda context: context_has_errors(context), "Job has failures.")
 """Scope condition that returns ``True`` if *any* errors have been recorded."""
 
 
-job_succeeding = _JobScopeCondition(lambda context: bool(not context.get_errors()), "Job is succeeding.")
+job_succeeding = _JobScopeCondition(lambda context: not context_has_errors(context), "Job is succeeding.")
 """Scope condition that returns ``True`` if *no* errors have been recorded."""
 
 
 def scope_failing(scope: JobScopeID) -> JobCallable[JobConditionalValueType]:
     """Scope condition that returns ``True`` if errors have been recorded for the provided `scope`."""
-    return _JobScopeCondition(lambda context: bool(context.get_errors(scope)), f"{scope} has failures.")
+    return _JobScopeCondition(lambda context: context_has_errors(context, scope), f"{scope} has failures.")
 
 
 def scope_succeeding(scope: JobScopeID) -> JobCallable[JobConditionalValueType]:
     """Scope condition that returns ``True`` if *no* errors have been recorded for the provided `scope`."""
-    return _JobScopeCondition(lambda context: bool(not context.get_errors(scope)), f"{scope} is succeeding.")
+    return _JobScopeCondition(lambda context: not context_has_errors(context, scope), f"{scope} is succeeding.")
 
 
 @runtime_checkable
@@ -723,6 +766,20 @@ class JobTeardownScope(JobScope, Protocol):
     def teardown(self, context: JobContext): ...
 
 
+class JobScopeKind:
+    """
+    Bit flags identifying the scope protocols a scope class implements.
+
+    Scope classes may declare a ``_scope_kind`` class attribute combining these flags so that runners can
+    dispatch on it instead of checking each protocol with ``isinstance``.
+    """
+
+    GROUP: Final[int] = 1
+    ACTION: Final[int] = 2
+    TEARDOWN: Final[int] = 4
+    CONDITIONAL: Final[int] = 8
+
+
 class JobAction(JobCallable[None], ABC):
     """
     A class that performs an action and an optional teardown action.
@@ -802,12 +859,15 @@ class lazy_action(JobAction, Generic[A]):
         self._action_instance: A | None = None
 
     def _get_action_instance(self, context: JobContext) -> A:
-        if self._action_instance is None:
-            self._action_instance = self._action_type(
-                *resolve_values(self._args, context=context),
-                **resolve_map(self._kwargs, context=context),
-            )
-        return self._action_instance
+        action_instance: A | None = self._action_instance
+        if action_instance is not None:
+            return action_instance
+        action_instance = self._action_type(
+            *resolve_values(self._args, context=context),
+            **resolve_map(self._kwargs, context=context),
+        )
+        self._action_instance = action_instance
+        return action_instance
 
     def action(self, context: JobContext) -> None:
         self._get_action_instance(context).action(context)
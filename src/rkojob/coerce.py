@@ -4,6 +4,7 @@
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
 import os
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Any
@@ -89,4 +90,10 @@ def as_path(value: str | PathLike | None) -> Path | None:
     """
     if value is None or isinstance(value, Path):
         return value
-    return Path(os.fspath(value))
+    return _path(os.fspath(value))
+
+
+# `Path` instances are immutable, so the same instance is returned for repeated values.
+@lru_cache(maxsize=256)
+def _path(value: str) -> Path:
+    return Path(value)
@@ -5,10 +5,10 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import AbstractContextManager
 from typing import (
     Any,
-    Generator,
+    Callable,
     Tuple,
 )
 
@@ -34,62 +34,106 @@ class JobScopeStatuses(JobBaseStatus):
     including errors that occurred within each scope.
     """
 
+    # Detail messages don't affect scope statuses.
+    detail_enabled: bool = False
+
     def __init__(self) -> None:
-        self._statuses: dict[JobScopeID, JobScopeStatus] = {}
+        # Statuses and errors are keyed by scope ID so scopes and scope references resolve alike.
+        self._statuses: dict[str, JobScopeStatus] = {}
         self._scope_stack: list[JobScope] = []
-        self._errors: dict[tuple[JobScopeID, ...], list[str | Exception]] = {}
+        # All errors in the order recorded, and the indexes of the errors recorded within each scope.
+        self._errors: list[str | Exception] = []
+        self._error_indexes: dict[str, list[int]] = {}
 
     def get_status(self, scope: JobScopeID) -> JobScopeStatus:
-        return self._statuses.get(scope, JobScopeStatus.UNKNOWN)
+        return self._statuses.get(scope.id, JobScopeStatus.UNKNOWN)
 
     def get_errors(self, scope: JobScopeID | None = None) -> list[str | Exception]:
-        errors: list[str | Exception] = []
-        for scopes in self._errors:
-            if scope is None or scope in scopes:
-                errors.extend(self._errors[scopes])
-        return errors
+        if scope is None:
+            return self._errors[:]
+        errors: list[str | Exception] = self._errors
+        return [errors[index] for index in self._error_indexes.get(scope.id, ())]
+
+    def has_errors(self, scope: JobScopeID | None = None) -> bool:
+        if scope is None:
+            return bool(self._errors)
+        return scope.id in self._error_indexes
 
     def start_scope(self, scope: JobScope) -> None:
         if self.get_status(scope) != JobScopeStatus.UNKNOWN:
             raise JobException("Scope status already set.")
         self._scope_stack.append(scope)
-        self._statuses[scope] = JobScopeStatus.RUNNING
+        self._statuses[scope.id] = JobScopeStatus.RUNNING
 
     def finish_scope(self, scope: JobScope | None = None) -> None:
         if scope and scope is not self._scope_stack[-1]:
             raise JobException("Scope does not match scope on stack.")
         scope = self._scope_stack.pop()
-        self._statuses[scope] = JobScopeStatus.FAILED if self.get_errors(scope) else JobScopeStatus.PASSED
+        self._statuses[scope.id] = JobScopeStatus.FAILED if self.has_errors(scope) else JobScopeStatus.PASSED
 
     def finish_item(self, outcome: str = "done.", error: str | Exception | None = None) -> None:
         if error:
             self.error(error)
 
     def skip_scope(self, scope: JobScope, reason: str | None = None) -> None:
-        self._statuses[scope] = JobScopeStatus.SKIPPED
+        self._statuses[scope.id] = JobScopeStatus.SKIPPED
 
     def error(self, error: Exception | str) -> None:
-        key: Tuple[JobScopeID, ...] = tuple([scope for scope in self._scope_stack])
-        if key not in self._errors:
-            self._errors[key] = []
-        self._errors[key].append(error)
-        if key:
+        index: int = len(self._errors)
+        self._errors.append(error)
+        for scope in self._scope_stack:
+            self._error_indexes.setdefault(scope.id, []).append(index)
+        if self._scope_stack:
             # If we have a running scope mark it as failing
-            self._statuses[key[-1]] = JobScopeStatus.FAILING
+            self._statuses[self._scope_stack[-1].id] = JobScopeStatus.FAILING
 
 
 class JobContextState:
+    __slots__ = ("scope", "_teardown")
+
     def __init__(self, *, scope: JobScope) -> None:
         self.scope: JobScope = scope
-        # Teardown actions registered ad-hoc
-        self.teardown: Delegate[[JobContext], None] = Delegate(continue_on_error=True, reverse=True)
+        # Teardown actions registered ad-hoc, created on first use.
+        self._teardown: Delegate[[JobContext], None] | None = None
+
+    @property
+    def teardown(self) -> Delegate[[JobContext], None]:
+        if self._teardown is None:
+            self._teardown = Delegate(continue_on_error=True, reverse=True)
+        return self._teardown
+
+
+class _InScope:
+    # Context manager returned by JobContextImpl.in_scope, lighter than a @contextmanager generator.
+    __slots__ = ("_context", "_scope")
+
+    def __init__(self, context: JobContextImpl, scope: JobScope) -> None:
+        self._context: JobContextImpl = context
+        self._scope: JobScope = scope
+
+    def __enter__(self) -> JobScope:
+        self._context._enter_scope(self._scope)
+        return self._scope
+
+    def __exit__(self, exc_type, exc_value, traceback, /) -> None:
+        self._context._exit_scope(self._scope)
 
 
 class JobContextImpl:
     def __init__(self, *, values: dict[str, Any] | None = None, status_writer: JobStatusWriter | None = None) -> None:
         # State that pushes and pops with the scope.
         self._state_stack: list[JobContextState] = []
+        # States are allocated once per stack depth and reused by later scopes at the same depth.
+        self._state_pool: list[JobContextState] = []
         self._known_scopes: dict[str, JobScope] = {}
+        # The scopes of the states on the stack, rebuilt as scopes are entered and exited.
+        self._scopes: Tuple[JobScope, ...] = ()
+        # States on the stack by scope ID, for lookups that don't need the stack order.
+        self._state_by_id: dict[str, JobContextState] = {}
+        # Bound methods used when entering and exiting scopes.
+        self._push_state: Callable[[JobContextState], None] = self._state_stack.append
+        self._pop_state: Callable[[], JobContextState] = self._state_stack.pop
+        self._add_known_scope: Callable[[str, JobScope], None] = self._known_scopes.__setitem__
         if values is None:
             values = {}
         self._values: Values = Values(**values)
@@ -99,29 +143,39 @@ class JobContextImpl:
         if status_writer:
             self._status.add_listener(status_writer)
 
-    @contextmanager
-    def in_scope(self, scope: JobScope) -> Generator[JobScope, None, None]:
+    def in_scope(self, scope: JobScope) -> AbstractContextManager[JobScope]:
         """
         Enter into *scope* for the duration of the ``with`` block.
 
         :param scope: The scope to enter.
-        :yields: The same *scope* instance for convenience.
+        :returns: A context manager that yields the same *scope* instance for convenience.
         """
-        try:
-            self._enter_scope(scope)
-            yield scope
-        finally:
-            self._exit_scope(scope)
+        return _InScope(self, scope)
 
     def _enter_scope(self, scope: JobScope) -> None:
-        state: JobContextState = JobContextState(scope=scope)
-        self._state_stack.append(state)
-        self._known_scopes[scope.id] = scope
+        state: JobContextState
+        depth: int = len(self._state_stack)
+        if depth < len(self._state_pool):
+            state = self._state_pool[depth]
+            state.scope = scope
+        else:
+            state = JobContextState(scope=scope)
+            self._state_pool.append(state)
+        self._push_state(state)
+        self._add_known_scope(scope.id, scope)
+        self._scopes += (scope,)
+        # Keep the outermost state if a scope is entered more than once.
+        self._state_by_id.setdefault(scope.id, state)
 
     def _exit_scope(self, scope: JobScope) -> None:
-        state: JobContextState = self._state_stack.pop()
+        state: JobContextState = self._pop_state()
         if state.scope is not scope:  # pragma: no cover
             raise JobException("Unexpected scope found on stack!")
+        # Release ad-hoc teardowns so a reused state starts without any.
+        state._teardown = None
+        self._scopes = self._scopes[:-1]
+        if self._state_by_id.get(scope.id) is state:
+            del self._state_by_id[scope.id]
 
     @property
     def scope(self) -> JobScope:
@@ -135,19 +189,21 @@ class JobContextImpl:
         """
         :returns: The full scope stack from outermost to innermost.
         """
-        return tuple(state.scope for state in self._state_stack)
+        return self._scopes
 
     def add_teardown(self, scope: JobScopeID, teardown: JobCallable[None]) -> None:
         scope = self._resolve_scope(scope)
         if not isinstance(scope, JobTeardownScope):
             raise JobException(f"Scope {scope} does not support teardown.")
-        self._get_state(scope).teardown += teardown
+        self._get_state(scope).teardown.add_callback(teardown)
 
     def remove_teardown(self, scope: JobScopeID, teardown: JobCallable[None]) -> None:
         scope = self._resolve_scope(scope)
         if not isinstance(scope, JobTeardownScope):
             raise JobException(f"Scope {scope} does not support teardown.")
-        self._get_state(scope).teardown -= teardown
+        state: JobContextState = self._get_state(scope)
+        if state._teardown is not None:
+            state._teardown.remove_callback(teardown)
 
     def get_teardown(self, scope: JobScopeID) -> Delegate[[JobContext], None]:
         scope = self._resolve_scope(scope)
@@ -170,38 +226,40 @@ class JobContextImpl:
             return self._resolve_scope(scope)
 
         scope_index: int
-        scopes: list[JobScope] = list(self.scopes)
+        states: list[JobContextState] = self._state_stack
         if generation < 0:
             # Get a scope relative to the root
             scope_index = -1
+        elif scope is None or (states and scope is states[-1].scope):
+            # Get a scope relative to the current scope
+            scope_index = len(states) - 1
         else:
             # Get a scope relative to scope
-            if scope is None:
-                scope_index = len(scopes) - 1
+            scope = self._resolve_scope(scope)
+            for scope_index, state in enumerate(states):
+                if state.scope == scope:
+                    break
             else:
-                scope = self._resolve_scope(scope)
-                try:
-                    scope_index = scopes.index(scope)
-                except ValueError:
-                    raise JobException(f"Scope '{scope}' is not in scope")
+                raise JobException(f"Scope '{scope}' is not in scope")
 
         scope_index -= generation
-        if scope_index < 0 or scope_index >= len(scopes):
+        if scope_index < 0 or scope_index >= len(states):
             raise JobException(
                 f"Unable to get scope relative to {'root' if generation < 0 else scope} using generation={generation}"
             )
 
-        return scopes[scope_index]
+        return states[scope_index].scope
 
     def _resolve_scope(self, scope_id: JobScopeID) -> JobScope:
         if isinstance(scope_id, JobScope):
             # Scope ID is the scope itself.
             return scope_id
 
-        if scope_id.id not in self._known_scopes:
+        scope: JobScope | None = self._known_scopes.get(scope_id.id)
+        if scope is None:
             raise JobException(f"Scope with ID '{scope_id.id}' is not known to this context.")
 
-        return self._known_scopes[scope_id.id]
+        return scope
 
     @property
     def status(self) -> JobStatusCollector:
@@ -216,7 +274,7 @@ class JobContextImpl:
             raise JobException("Context has no scope")
         if scope is None:
             return self._state_stack[-1]
-        state: JobContextState | None = next(iter(it for it in self._state_stack if it.scope.id == scope.id), None)
+        state: JobContextState | None = self._state_by_id.get(scope.id)
         if state is None:
             raise JobException(f"No state found for scope '{scope}'")
         return state
@@ -245,6 +303,15 @@ class JobContextImpl:
             for error in self._scope_statuses.get_errors(scope)
         ]
 
+    def has_errors(self, scope: JobScopeID | None = None) -> bool:
+        """
+        Return whether any exceptions were recorded for *scope* or for *any* scope if omitted.
+
+        :param scope: Scope to check for exceptions, or ``None`` to check all scopes.
+        :returns: ``True`` if exceptions were recorded.
+        """
+        return self._scope_statuses.has_errors(scope)
+
     @property
     def values(self) -> Values:
         return self._values
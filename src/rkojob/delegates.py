@@ -39,6 +39,8 @@ class Delegate(Iterable[CallbackType], Generic[P, R]):
         :param reverse: Invoke callbacks in reverse order.
         """
         self._callbacks: list[CallbackType] = []
+        # Immutable snapshot of _callbacks, rebuilt on mutation and iterated on dispatch.
+        self._callbacks_tuple: tuple[CallbackType, ...] = ()
         if continue_on_error is None:
             continue_on_error = False
         self._continue_on_error: bool = continue_on_error
@@ -46,6 +48,11 @@ class Delegate(Iterable[CallbackType], Generic[P, R]):
             reverse = False
         self._reverse: bool = reverse
 
+    @property
+    def continue_on_error(self) -> bool:
+        """Whether callbacks continue to be invoked after a callback raises an error."""
+        return self._continue_on_error
+
     def add_callback(self, callback: CallbackType):
         """
         Add a callback to this delegate. The callback will be invoked when the delegate is called.
@@ -61,10 +68,12 @@ class Delegate(Iterable[CallbackType], Generic[P, R]):
             self._callbacks.insert(0, callback)
         else:
             self._callbacks.append(callback)
+        self._callbacks_tuple = tuple(self._callbacks)
 
     def remove_callback(self, callback: CallbackType):
         if callback in self._callbacks:
             self._callbacks.remove(callback)
+            self._callbacks_tuple = tuple(self._callbacks)
 
     def __iadd__(self, other: CallbackType | Delegate[P, R]) -> Delegate[P, R]:
         if isinstance(other, Delegate):
@@ -108,10 +117,10 @@ class Delegate(Iterable[CallbackType], Generic[P, R]):
         return result
 
     def __bool__(self) -> bool:
-        return bool(self._callbacks)
+        return bool(self._callbacks_tuple)
 
     def __iter__(self) -> Iterator[CallbackType]:
-        return iter(self._callbacks)
+        return iter(self._callbacks_tuple)
 
     def __call__(self, *arg: P.args, **kwargs: P.kwargs) -> list[R | Exception | None]:
         """
@@ -121,8 +130,9 @@ class Delegate(Iterable[CallbackType], Generic[P, R]):
         :param **kwargs: The keyword parameters to pass to each callback.
         :returns: A list of the results from each of the callbacks.
         """
-        results: list[R | Exception | None] = [None] * len(self._callbacks)
-        for index, callback in enumerate(self):
+        callbacks: tuple[CallbackType, ...] = self._callbacks_tuple
+        results: list[R | Exception | None] = [None] * len(callbacks)
+        for index, callback in enumerate(callbacks):
             try:
                 results[index] = callback(*arg, **kwargs)
             except Exception as e:
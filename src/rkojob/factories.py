@@ -6,14 +6,14 @@
 import sys
 
 from rkojob import JobContext, JobRunner
+from rkojob.context import JobContextImpl
+from rkojob.runner import JobRunnerImpl
+from rkojob.writer import JobStatusWriter
 
 
 class JobContextFactory:
     @classmethod
     def create(cls, *args, **kwargs) -> JobContext:
-        from rkojob.context import JobContextImpl
-        from rkojob.writer import JobStatusWriter
-
         status_writer: JobStatusWriter = kwargs.get("status_writer") or JobStatusWriter(
             stream=sys.stdout,
             show_detail=False,
@@ -24,6 +24,4 @@ class JobContextFactory:
 class JobRunnerFactory:
     @classmethod
     def create(cls, *args, **kwargs) -> JobRunner:
-        from rkojob.runner import JobRunnerImpl
-
         return JobRunnerImpl()
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
-from contextlib import AbstractContextManager, contextmanager
+import sys
+from contextlib import AbstractContextManager
 from enum import Enum, auto
-from typing import Generator, Generic, TypeVar
+from types import TracebackType
+from typing import Callable, ClassVar, Generic, TypeVar
 
 from rkojob import (
     Delegate,
@@ -15,6 +17,7 @@ from rkojob import (
     JobConditionalType,
     JobContext,
     JobScopeID,
+    JobScopeKind,
     JobScopeType,
     create_scope_id,
     delegate,
@@ -29,23 +32,43 @@ class JobScopes(Enum):
     JOB = auto()
 
     def __str__(self) -> str:
-        return self.name.capitalize()
+        return _JOB_SCOPE_STRS[self]
+
+
+_JOB_SCOPE_STRS: dict[JobScopes, str] = {scope: scope.name.capitalize() for scope in JobScopes}
 
 
 class JobScopeIDMixin(JobScopeID):
-    _id: str
+    __slots__ = ("_scope_id", "_id_hash")
+
+    _scope_id: str
+    _id_hash: int
+
+    @property
+    def _id(self) -> str:
+        return self._scope_id
+
+    @_id.setter
+    def _id(self, value: str) -> None:
+        # IDs are set once, so the hash is computed up front for use as a dict key. Interning lets lookups of IDs
+        # passed in by callers match by identity.
+        value = sys.intern(value)
+        self._scope_id = value
+        self._id_hash = hash(value)
 
     @property
     def id(self) -> str:
-        return self._id
+        return self._scope_id
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, JobScopeIDMixin):
+            return self._scope_id == other._scope_id
         if isinstance(other, JobScopeID):
-            return self.id == other.id
+            return self._scope_id == other.id
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return self._id_hash
 
 
 A = TypeVar("A", bound=JobCallable[None])
@@ -56,6 +79,10 @@ class JobStep(JobScopeIDMixin, Generic[A]):
     Class representing a job step.
     """
 
+    __slots__ = ("_name", "_action", "_run_if", "_skip_if", "_teardown_delegate", "_str")
+
+    _scope_kind: ClassVar[int] = JobScopeKind.ACTION | JobScopeKind.TEARDOWN | JobScopeKind.CONDITIONAL
+
     def __init__(
         self,
         name: str,
@@ -70,6 +97,8 @@ class JobStep(JobScopeIDMixin, Generic[A]):
         self._run_if: JobConditionalType | None = run_if
         self._skip_if: JobConditionalType | None = skip_if
         self._id = id or create_scope_id()
+        # Name and type don't change, so the string form is built once.
+        self._str: str = f"{self.type} {name}"
 
         if action:
             self.action = action
@@ -110,7 +139,7 @@ class JobStep(JobScopeIDMixin, Generic[A]):
         self._skip_if = value
 
     def __str__(self) -> str:
-        return f"{self.type} {self.name}"
+        return self._str
 
 
 class JobStage(JobScopeIDMixin):
@@ -118,12 +147,17 @@ class JobStage(JobScopeIDMixin):
     Class representing a job stage that consists of one or more steps.
     """
 
+    __slots__ = ("_name", "steps", "_teardown_delegate", "_str")
+
+    _scope_kind: ClassVar[int] = JobScopeKind.GROUP | JobScopeKind.TEARDOWN
+
     def __init__(self, name: str, steps: list[JobStep] | None = None, id: str | None = None) -> None:
         self._name: str = name
         if steps is None:
             steps = []
         self.steps: list[JobStep] = steps
-        self._id: str = id or create_scope_id()
+        self._id = id or create_scope_id()
+        self._str: str = f"{self.type} {name}"
 
     @property
     def name(self) -> str:
@@ -141,7 +175,7 @@ class JobStage(JobScopeIDMixin):
     def teardown(self, context: JobContext) -> None: ...
 
     def __str__(self) -> str:
-        return f"{self.type} {self.name}"
+        return self._str
 
 
 class Job(JobScopeIDMixin):
@@ -149,12 +183,17 @@ class Job(JobScopeIDMixin):
     Class representing a job that consists of one or more stages.
     """
 
+    __slots__ = ("_name", "stages", "_teardown_delegate", "_str")
+
+    _scope_kind: ClassVar[int] = JobScopeKind.GROUP | JobScopeKind.TEARDOWN
+
     def __init__(self, name: str, stages: list[JobStage] | None = None, id: str | None = None) -> None:
         self._name: str = name
         if stages is None:
             stages = []
         self.stages: list[JobStage] = stages
-        self._id: str = id or create_scope_id()
+        self._id = id or create_scope_id()
+        self._str: str = f"{self.type} {name}"
 
     @property
     def name(self) -> str:
@@ -172,17 +211,49 @@ class Job(JobScopeIDMixin):
     def teardown(self, context: JobContext) -> None: ...
 
     def __str__(self) -> str:
-        return f"{self.type} {self.name}"
+        return self._str
+
+
+B = TypeVar("B")
+S = TypeVar("S")
+
+
+class _BuildScope(Generic[B, S]):
+    """
+    Context manager that yields a builder and, if the `with` block completes without error, adds the scope it builds
+    to a list.
+    """
+
+    __slots__ = ("_builder", "_build", "_built")
+
+    def __init__(self, builder: B, build: Callable[[], S], built: list[S]) -> None:
+        self._builder: B = builder
+        self._build: Callable[[], S] = build
+        self._built: list[S] = built
+
+    def __enter__(self) -> B:
+        return self._builder
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self._built.append(self._build())
 
 
 class JobStepBuilder(JobScopeIDMixin):
+    __slots__ = ("_name", "action", "teardown", "run_if", "skip_if", "builds_type")
+
     def __init__(self, name: str) -> None:
         self._name: str = name
         self.action: JobCallable[None] | None = None
         self.teardown: Delegate[[JobContext], None] = Delegate(continue_on_error=True)
         self.run_if: JobConditionalType | None = None
         self.skip_if: JobConditionalType | None = None
-        self._id: str = create_scope_id()
+        self._id = create_scope_id()
         self.builds_type: JobScopeType = JobScopes.STEP
 
     def build(self) -> JobStep:
@@ -201,18 +272,18 @@ class JobStepBuilder(JobScopeIDMixin):
 
 
 class JobStageBuilder(JobScopeIDMixin):
+    __slots__ = ("_name", "_steps", "teardown", "builds_type")
+
     def __init__(self, name: str) -> None:
         self._name: str = name
         self._steps: list[JobStep] = []
         self.teardown: Delegate[[JobContext], None] = Delegate(continue_on_error=True)
-        self._id: str = create_scope_id()
+        self._id = create_scope_id()
         self.builds_type: JobScopeType = JobScopes.STAGE
 
-    @contextmanager
-    def step(self, name: str) -> Generator[JobStepBuilder, None, None]:
+    def step(self, name: str) -> _BuildScope[JobStepBuilder, JobStep]:
         builder: JobStepBuilder = JobStepBuilder(name)
-        yield builder
-        self._steps.append(builder.build())
+        return _BuildScope(builder, builder.build, self._steps)
 
     def build(self) -> JobStage:
         stage: JobStage = JobStage(name=self._name, steps=self._steps, id=self._id)
@@ -228,17 +299,15 @@ class JobBuilder(JobScopeIDMixin, AbstractContextManager):
         self._name: str = name
         self._stages: list[JobStage] = []
         self.teardown: Delegate[[JobContext], None] = Delegate(continue_on_error=True)
-        self._id: str = create_scope_id()
+        self._id = create_scope_id()
         self.builds_type: JobScopeType = JobScopes.JOB
 
     def __exit__(self, exc_type, exc_value, traceback, /):
         pass
 
-    @contextmanager
-    def stage(self, name: str) -> Generator[JobStageBuilder, None, None]:
+    def stage(self, name: str) -> _BuildScope[JobStageBuilder, JobStage]:
         builder: JobStageBuilder = JobStageBuilder(name)
-        yield builder
-        self._stages.append(builder.build())
+        return _BuildScope(builder, builder.build, self._stages)
 
     def build(self) -> Job:
         job: Job = Job(name=self._name, stages=self._stages, id=self._id)
@@ -3,10 +3,12 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
-from typing import Any, cast
+from contextlib import ExitStack
+from typing import Any, Iterable, cast
 
 from rkojob import (
     JobActionScope,
+    JobCallable,
     JobConditionalScope,
     JobConditionalType,
     JobConditionalValueType,
@@ -14,20 +16,35 @@ from rkojob import (
     JobException,
     JobGroupScope,
     JobScope,
+    JobScopeKind,
+    JobStatusCollector,
     JobTeardownScope,
+    context_has_errors,
+    job_always,
     job_failing,
     job_never,
+    job_succeeding,
     resolve_value,
 )
 from rkojob.delegates import Delegate
 from rkojob.util import deep_flatten
 
+# Kinds of scope the runner knows how to run.
+_RUNNABLE: int = JobScopeKind.GROUP | JobScopeKind.ACTION | JobScopeKind.TEARDOWN
+
+# Result of resolving `job_never`.
+_NEVER: tuple[bool, str] = (False, "Never")
+
 
 class JobRunnerImpl:
     """
     Runner for job scopes.
     """
 
+    def __init__(self) -> None:
+        # Kinds of the scope classes seen by this runner.
+        self._scope_kinds: dict[type, int] = {}
+
     def run(self, context: JobContext, scope: JobScope) -> None:
         """
         Runs a job scope
@@ -35,68 +52,137 @@ class JobRunnerImpl:
         :param scope: The scope to run.
         """
         self._run_scope(context, scope)
-        errors: list[Exception] = context.get_errors()
-        if errors:
-            raise JobException("\n".join([str(e) for e in errors]))
+        if context_has_errors(context):
+            raise JobException("\n".join([str(e) for e in context.get_errors()]))
 
     def _run_scope(self, context: JobContext, scope: JobScope) -> None:
         # Run and then teardown a scope.
-        # If the scope is a group, recursively run and teardown child scopes.
-
-        group: JobGroupScope | None = scope if isinstance(scope, JobGroupScope) else None
-        action: JobActionScope | None = scope if isinstance(scope, JobActionScope) else None
-        teardown: JobTeardownScope | None = scope if isinstance(scope, JobTeardownScope) else None
-        if not (group or action or teardown):
+        # If the scope is a group, run and teardown child scopes depth-first. The tree is walked with an explicit
+        # work stack rather than by recursion: each entry is either a scope to enter, or an open group scope (with
+        # its exit stack) to exit once all of its children have run.
+
+        work: list[tuple[JobScope, ExitStack | None]] = [(scope, None)]
+        # Exit stacks of the scopes that are currently entered, outermost first.
+        open_scopes: list[ExitStack] = []
+        try:
+            while work:
+                current, scope_stack = work.pop()
+                if scope_stack is not None:
+                    open_scopes.pop()
+                    scope_stack.close()
+                    continue
+
+                kind: int = self._scope_kind(current)
+                scope_stack = self._enter_scope(context, current, kind)
+                if scope_stack is None:
+                    continue
+                open_scopes.append(scope_stack)
+
+                if kind & JobScopeKind.GROUP:
+                    work.append((current, scope_stack))
+                    work.extend((child, None) for child in reversed(cast(JobGroupScope, current).scopes))
+                    continue
+                if kind & JobScopeKind.ACTION:
+                    self._run_action(context, cast(JobActionScope, current))
+                open_scopes.pop()
+                scope_stack.close()
+        except BaseException:
+            # Exit the scopes that are still open, innermost first, as nested `with` statements would.
+            with ExitStack() as unwind:
+                for open_scope in open_scopes:
+                    unwind.push(open_scope)
+                raise
+
+    def _enter_scope(self, context: JobContext, scope: JobScope, kind: int) -> ExitStack | None:
+        # Enter a scope, returning the stack used to exit it, or None if the scope is skipped.
+        if not kind & _RUNNABLE:
             raise self._unknown_scope(context, scope)
 
+        status: JobStatusCollector = context.status
         should_skip: bool
         skip_reason: str
-        should_skip, skip_reason = self._should_skip(context, scope)
+        should_skip, skip_reason = self._should_skip(context, scope, kind)
         if should_skip:
-            context.status.skip_scope(scope, reason=skip_reason or None)
-            return
-
-        with context.in_scope(scope), context.status.scope(scope):
-            try:
-                if group:
-                    self._run_group(context, group)
-                elif action:
-                    self._run_action(context, action)
-            finally:
-                if teardown:
-                    self._run_teardown(context, teardown)
-
-    def _run_group(self, context: JobContext, group: JobGroupScope) -> None:
-        # Recursively run a group's child scopes
-        for child in group.scopes:
-            self._run_scope(context, child)
+            status.skip_scope(scope, reason=skip_reason or None)
+            return None
+
+        scope_stack: ExitStack = ExitStack()
+        with scope_stack:
+            scope_stack.enter_context(context.in_scope(scope))
+            scope_stack.enter_context(status.scope(scope))
+            if kind & JobScopeKind.TEARDOWN:
+                scope_stack.callback(self._run_teardown, context, cast(JobTeardownScope, scope))
+            return scope_stack.pop_all()
+
+    def _scope_kind(self, scope: JobScope) -> int:
+        # Use the kind declared by the scope's class, checking each protocol for classes that don't declare one.
+        # Kinds are cached by class, so the protocols are only checked for the first scope of each class.
+        scope_type: type = type(scope)
+        kind: int | None = self._scope_kinds.get(scope_type)
+        if kind is not None:
+            return kind
+        kind = getattr(scope_type, "_scope_kind", None)
+        if kind is None:
+            kind = (
+                (JobScopeKind.GROUP if isinstance(scope, JobGroupScope) else 0)
+                | (JobScopeKind.ACTION if isinstance(scope, JobActionScope) else 0)
+                | (JobScopeKind.TEARDOWN if isinstance(scope, JobTeardownScope) else 0)
+                | (JobScopeKind.CONDITIONAL if isinstance(scope, JobConditionalScope) else 0)
+            )
+        self._scope_kinds[scope_type] = kind
+        return kind
 
     def _run_action(self, context: JobContext, action: JobActionScope) -> None:
         # Run a scope's action
-        if action.action:
+        action_callable: JobCallable[None] | None = action.action
+        if action_callable:
             try:
-                action.action(context)
+                action_callable(context)
             except Exception as e:
                 # Add error to current scope's list of errors
                 context.status.error(e)
 
     def _run_teardown(self, context: JobContext, teardown: JobTeardownScope) -> None:
-        all_teardowns: Delegate[[JobContext], None] = Delegate(continue_on_error=True)
-        all_teardowns += context.get_teardown(teardown)
-        all_teardowns += teardown.teardown
-        if all_teardowns:
-            with context.status.section(f"Teardown {teardown}"):
-                results: list[Any] = all_teardowns(context)
-                for result in deep_flatten(results):
-                    if isinstance(result, Exception):
-                        context.status.warning(result)
-        else:
-            context.status.detail(f"Skipping Teardown {teardown}")
+        status: JobStatusCollector = context.status
+        context_teardown: Delegate[[JobContext], None] = context.get_teardown(teardown)
+        scope_teardown: Delegate[[JobContext], None] = teardown.teardown
+        if not context_teardown and not scope_teardown:
+            if status.detail_enabled:
+                status.detail(f"Skipping Teardown {teardown}")
+            return
 
-    def _should_skip(self, context: JobContext, scope: JobScope) -> tuple[bool, str]:
-        if isinstance(scope, JobConditionalScope):
-            run_if: JobConditionalType | None = scope.run_if
-            skip_if: JobConditionalType | None = scope.skip_if
+        # When only one delegate has callbacks and it already collects errors, call it directly instead of
+        # combining both into a new delegate.
+        all_teardowns: Delegate[[JobContext], None]
+        if not scope_teardown and context_teardown.continue_on_error:
+            all_teardowns = context_teardown
+        elif not context_teardown and scope_teardown.continue_on_error:
+            all_teardowns = scope_teardown
+        else:
+            all_teardowns = Delegate(continue_on_error=True)
+            all_teardowns += context_teardown
+            all_teardowns += scope_teardown
+        with status.section(f"Teardown {teardown}"):
+            results: list[Any] = all_teardowns(context)
+            for result in results:
+                # Results are usually None or an exception. Only flatten the nested results of callbacks
+                # that return collections.
+                if result is None:
+                    continue
+                if isinstance(result, Exception):
+                    status.warning(result)
+                elif isinstance(result, Iterable) and not isinstance(result, (str, bytes)):
+                    for nested in deep_flatten(result):
+                        if isinstance(nested, Exception):
+                            status.warning(nested)
+
+    def _should_skip(self, context: JobContext, scope: JobScope, kind: int | None = None) -> tuple[bool, str]:
+        if kind is None:
+            kind = self._scope_kind(scope)
+        if kind & JobScopeKind.CONDITIONAL:
+            conditional: JobConditionalScope = cast(JobConditionalScope, scope)
+            run_if: JobConditionalType | None = conditional.run_if
+            skip_if: JobConditionalType | None = conditional.skip_if
 
             if skip_if is None and run_if is None:
                 # No condition specified; Use the default.
@@ -121,9 +207,14 @@ class JobRunnerImpl:
             return self._resolve_conditional(context, skip_if)
 
         # If it is not a conditional scope, never skip.
-        return self._resolve_conditional(context, job_never)
+        return _NEVER
 
     def _resolve_conditional(self, context: JobContext, conditional: JobConditionalType) -> tuple[bool, str]:
+        if conditional is job_never:
+            return _NEVER
+        if conditional is job_failing or conditional is job_succeeding or conditional is job_always:
+            # Built-in conditions are called directly, skipping resolve_value's type checks.
+            return cast(tuple[bool, str], conditional(context))
         value: JobConditionalValueType | None = cast(
             JobConditionalValueType, resolve_value(conditional, context=context)
         )
@@ -5,12 +5,119 @@
 
 from __future__ import annotations
 
+import codecs
+import io
+import locale
 import os
 import re
+import selectors
+import string
 import subprocess
 import sys
+import threading
+from functools import lru_cache
 from os import PathLike
-from typing import IO, Any, Iterable
+from typing import IO, Any, Callable, Iterable, Iterator
+
+# Most output that is available from a pipe at once.
+_CHUNK_SIZE: int = 65536
+
+# Buffer size of tee files opened by `Shell`.
+_TEE_BUFFER_SIZE: int = 1024 * 1024
+
+# Whether subprocess pipes can be waited on with `selectors`. On Windows `select()` only accepts sockets, so `Shell`
+# drains each pipe on its own thread instead.
+_SELECTABLE_PIPES: bool = sys.platform != "win32"
+
+
+def _read_chunks(stream: io.BufferedIOBase, encoding: str) -> Iterator[str]:
+    # Read output as it becomes available, up to _CHUNK_SIZE bytes at a time. Chunks are decoded incrementally so
+    # that characters split across reads are decoded whole, and newlines are translated as they are in text mode.
+    # Each step reads once and yields the decoded text, which may be empty, so steps can be driven by a selector.
+    decoder: io.IncrementalNewlineDecoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors="replace"), translate=True
+    )
+    while True:
+        data: bytes = stream.read1(_CHUNK_SIZE)
+        yield decoder.decode(data, final=not data)
+        if not data:
+            return
+
+
+def _normalize_tee(target: str | PathLike | IO[str] | None) -> str | IO[str] | None:
+    if isinstance(target, (str, PathLike)):
+        return os.fspath(target)
+    return target
+
+
+def _open_tee(target: str | PathLike | IO[str] | None) -> tuple[IO[str] | None, bool]:
+    # Returns the tee stream and whether it was opened here and should be closed.
+    if isinstance(target, (str, PathLike)):
+        return open(target, "w", encoding="utf-8", buffering=_TEE_BUFFER_SIZE), True
+    elif target is not None:
+        return target, False
+    return None, False
+
+
+def _pump_selector(streams: list[tuple[IO[bytes], Iterator[str], tuple[Callable[[str], Any], ...]]]) -> None:
+    # Read whichever stream has output available until all of them are at EOF.
+    selector: selectors.BaseSelector = selectors.DefaultSelector()
+    with selector:
+        for stream, stream_reader, stream_sinks in streams:
+            selector.register(stream, selectors.EVENT_READ, (stream_reader, stream_sinks))
+        while selector.get_map():
+            for key, _ in selector.select():
+                reader: Iterator[str]
+                sinks: tuple[Callable[[str], Any], ...]
+                reader, sinks = key.data
+                chunk: str | None = next(reader, None)
+                if chunk is None:
+                    selector.unregister(key.fileobj)
+                elif chunk:
+                    for sink in sinks:
+                        sink(chunk)
+
+
+def _pump_threads(streams: list[tuple[IO[bytes], Iterator[str], tuple[Callable[[str], Any], ...]]]) -> None:
+    # Drain every stream but the first on a thread of its own, and the first on this thread. Streams may share a sink
+    # (e.g. one tee for stdout and stderr), so writes are serialized with a lock. The first error raised while
+    # draining, on any thread, is re-raised once all threads have finished.
+    lock: threading.Lock = threading.Lock()
+    errors: list[BaseException] = []
+
+    def drain(reader: Iterator[str], sinks: tuple[Callable[[str], Any], ...]) -> None:
+        try:
+            for chunk in reader:
+                if chunk:
+                    with lock:
+                        for sink in sinks:
+                            sink(chunk)
+        except BaseException as e:
+            errors.append(e)
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=drain, args=(reader, sinks), daemon=True) for _, reader, sinks in streams[1:]
+    ]
+    for thread in threads:
+        thread.start()
+    if streams:
+        drain(streams[0][1], streams[0][2])
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _sinks(chunks: list[str] | None, show: IO[str] | None, tee: IO[str] | None) -> tuple[Callable[[str], Any], ...]:
+    # The functions a stream's output is written to.
+    sinks: list[Callable[[str], Any]] = []
+    if chunks is not None:
+        sinks.append(chunks.append)
+    if show:
+        sinks.append(show.write)
+    if tee:
+        sinks.append(tee.write)
+    return tuple(sinks)
 
 
 class ShellResult:
@@ -38,6 +145,8 @@ class Shell:
         stderr_to_stdout: bool = False,
         raise_on_error: bool = True,
         shell: bool = False,
+        capture_stdout: bool = True,
+        capture_stderr: bool = True,
     ) -> None:
         self._show_stdout: bool = show_stdout
         self._show_stderr: bool = show_stderr
@@ -48,6 +157,8 @@ class Shell:
         self._stderr_to_stdout: bool = stderr_to_stdout
         self._raise_on_error: bool = raise_on_error
         self._shell: bool = shell
+        self._capture_stdout: bool = capture_stdout
+        self._capture_stderr: bool = capture_stderr
 
         # for mocking
         self._popen: Any = subprocess.Popen
@@ -64,6 +175,8 @@ class Shell:
         stderr_to_stdout: bool | None = None,
         raise_on_error: bool | None = None,
         shell: bool | None = None,
+        capture_stdout: bool | None = None,
+        capture_stderr: bool | None = None,
     ) -> ShellResult:
         if show_stdout is None:
             show_stdout = self._show_stdout
@@ -83,18 +196,10 @@ class Shell:
             raise_on_error = self._raise_on_error
         if shell is None:
             shell = self._shell
-
-        def _normalize_tee(target: str | PathLike | IO[str] | None) -> str | IO[str] | None:
-            if isinstance(target, (str, PathLike)):
-                return os.fspath(target)
-            return target
-
-        def _open_tee(target: str | PathLike | IO[str] | None) -> tuple[IO[str] | None, bool]:
-            if isinstance(target, (str, PathLike)):
-                return open(target, "w", encoding="utf-8"), True
-            elif target is not None:
-                return target, False
-            return None, False
+        if capture_stdout is None:
+            capture_stdout = self._capture_stdout
+        if capture_stderr is None:
+            capture_stderr = self._capture_stderr
 
         tee_stdout = _normalize_tee(tee_stdout)
         tee_stderr = _normalize_tee(tee_stderr)
@@ -114,50 +219,63 @@ class Shell:
         # Choose stderr handling mode
         stderr_setting: int = subprocess.STDOUT if stderr_to_stdout else subprocess.PIPE
 
+        # Output is read from binary pipes in chunks and decoded here, using the encoding text mode would use.
         proc = self._popen(
             args,
             stdout=subprocess.PIPE,
             stderr=stderr_setting,
-            text=True,
             cwd=cwd,
             env=env,
             shell=shell,
         )
+        encoding: str = locale.getpreferredencoding(False)
 
-        stdout_lines: list[str] = []
-        stderr_lines: list[str] = []
+        stdout_chunks: list[str] = []
+        stderr_chunks: list[str] = []
 
-        # Capture and route stdout
+        # Capture and route stdout and, if separate, stderr. Both are read as output becomes available on either, so
+        # a process that fills one pipe while the other is being drained isn't blocked. Each stream is paired with the
+        # functions its output is written to, so enabled options aren't checked for each chunk.
+        streams: list[tuple[IO[bytes], Iterator[str], tuple[Callable[[str], Any], ...]]] = []
         if proc.stdout:
-            for line in proc.stdout:
-                stdout_lines.append(line)
-                if show_stdout:
-                    sys.stdout.write(line)
-                if stdout_tee:
-                    stdout_tee.write(line)
-                    stdout_tee.flush()
-
-        # Capture stderr if separate
+            streams.append(
+                (
+                    proc.stdout,
+                    _read_chunks(proc.stdout, encoding),
+                    _sinks(stdout_chunks if capture_stdout else None, sys.stdout if show_stdout else None, stdout_tee),
+                )
+            )
         if not stderr_to_stdout and proc.stderr:
-            for line in proc.stderr:
-                stderr_lines.append(line)
-                if show_stderr:
-                    sys.stderr.write(line)
-                if stderr_tee:
-                    stderr_tee.write(line)
-                    stderr_tee.flush()
+            streams.append(
+                (
+                    proc.stderr,
+                    _read_chunks(proc.stderr, encoding),
+                    _sinks(stderr_chunks if capture_stderr else None, sys.stderr if show_stderr else None, stderr_tee),
+                )
+            )
+        if _SELECTABLE_PIPES:
+            _pump_selector(streams)
+        else:
+            _pump_threads(streams)
 
         proc.wait()
 
-        if stdout_tee and close_stdout:
-            stdout_tee.close()
-        if stderr_tee and close_stderr:
-            stderr_tee.close()
+        # Tees are only flushed once all output has been written to them.
+        if stderr_tee and stderr_tee is not stdout_tee:
+            if close_stderr:
+                stderr_tee.close()
+            else:
+                stderr_tee.flush()
+        if stdout_tee:
+            if close_stdout:
+                stdout_tee.close()
+            else:
+                stdout_tee.flush()
 
         result: ShellResult = ShellResult(
             return_code=proc.returncode,
-            stdout="".join(stdout_lines),
-            stderr="".join(stderr_lines) if not stderr_to_stdout else "",
+            stdout="".join(stdout_chunks),
+            stderr="".join(stderr_chunks) if not stderr_to_stdout else "",
         )
 
         if raise_on_error and result.return_code != 0:
@@ -165,18 +283,50 @@ class Shell:
         return result
 
 
-def to_kebab(name: str) -> str:
-    # Insert dashes before capital letters
-    s = re.sub(r"(.)([A-Z][a-z]+)", r"\1-\2", name)
-    s = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", s)
-    # Replace underscores with dashes
-    s = s.replace("_", "-")
-    # Normalize consecutive dashes and lowercase
-    return re.sub(r"-+", "-", s).lower()
+_LOWER_OR_DIGIT: frozenset[str] = frozenset(string.ascii_lowercase + string.digits)
+
+_CAMEL_SPLIT: re.Pattern[str] = re.compile(r"[-_]")
 
 
+# Names are converted repeatedly for the same few options, so conversions are cached.
+@lru_cache(maxsize=2048)
+def to_kebab(name: str) -> str:
+    # Names that are already lowercase only need underscores replaced, unless that leaves dashes to collapse.
+    if name.islower():
+        kebab: str = name.replace("_", "-")
+        if "--" not in kebab:
+            return kebab
+
+    # Single pass over the name. Insert a dash before a capital letter that follows a lowercase letter or digit, or
+    # that starts a capitalized word. Replace underscores with dashes, collapse consecutive dashes and lowercase.
+    parts: list[str] = []
+    last: int = len(name) - 1
+    previous: str = ""
+    dashed: bool = False
+    for index, char in enumerate(name):
+        if char == "-" or char == "_":
+            if not dashed:
+                parts.append("-")
+                dashed = True
+        else:
+            if (
+                index
+                and not dashed
+                and "A" <= char <= "Z"
+                and (
+                    previous in _LOWER_OR_DIGIT or (previous != "\n" and index < last and "a" <= name[index + 1] <= "z")
+                )
+            ):
+                parts.append("-")
+            parts.append(char)
+            dashed = False
+        previous = char
+    return "".join(parts).lower()
+
+
+@lru_cache(maxsize=2048)
 def to_camel(name: str) -> str:
-    parts = re.split(r"[-_]", name)
+    parts = _CAMEL_SPLIT.split(name)
     return parts[0].lower() + "".join(word.capitalize() for word in parts[1:])
 
 
@@ -231,6 +381,8 @@ class ToolBuilder:
         """
         self._commands: list[str] = list(commands)
         self._shell: Shell | None = shell
+        # Builders for subcommands, by attribute name.
+        self._children: dict[str, ToolBuilder] = {}
 
     def prepare(self, *args, runner_type: type[ToolRunner] | None = None, **kwargs) -> ToolRunner:
         """
@@ -243,8 +395,15 @@ class ToolBuilder:
             runner_type = ToolRunner
         return runner_type(self._commands, *args, **kwargs, shell=self._shell)
 
-    def __getattr__(self, name: str):
-        return ToolBuilder(*self._commands, name, shell=self._shell)
+    def __getattr__(self, name: str) -> ToolBuilder:
+        # Private and special names are never subcommands. This also stops lookups of _children recursing before it
+        # has been set.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        child: ToolBuilder | None = self._children.get(name)
+        if child is None:
+            child = self._children[name] = ToolBuilder(*self._commands, name, shell=self._shell)
+        return child
 
     def __call__(self, *args: Any, **kwargs) -> ShellResult:
         runner: ToolRunner = self.prepare(*args, **kwargs)
@@ -273,6 +432,8 @@ class ToolRunner:
     Notes:
         - Keyword arguments are converted to CLI options using the same logic as `ToolBuilder`
         - Command-line arguments are "fixed up" just before execution (e.g., `_ → -`, bools handled)
+        - The command line is built once, from the arguments given at construction, and reused by later calls
+        - Subclasses can override the `command` property to change the command line that is executed
         - This class enables richer features like dry-run, logging, or command introspection
 
     See also:
@@ -285,13 +446,24 @@ class ToolRunner:
         self._args: list[Any] = list(args)
         self._kwargs: dict[str, Any] = kwargs
         self._shell: Shell = shell or Shell()
+        # The fixed up command, built on first use.
+        self._command: tuple[Any, ...] | None = None
 
     def __call__(self, *args, **kwargs) -> ShellResult:
         return self._shell(*self.command)
 
     @property
     def command(self) -> list[Any]:
-        return self._fixup_commands(self._commands) + self._fixup_args(self._args) + self._fixup_kwargs(self._kwargs)
+        """
+        :returns: A copy of the fixed up command line. It is built from the construction arguments on first access
+         and reused afterwards.
+        """
+        command: tuple[Any, ...] | None = self._command
+        if command is None:
+            command = self._command = tuple(
+                self._fixup_commands(self._commands) + self._fixup_args(self._args) + self._fixup_kwargs(self._kwargs)
+            )
+        return list(command)
 
     @classmethod
     def _fixup_commands(cls, parts: list[str]) -> list[str]:
@@ -299,14 +471,19 @@ class ToolRunner:
 
     @classmethod
     def _fixup_args(cls, args: Iterable[Any]) -> list[Any]:
+        # Flatten nested lists and tuples depth-first, using a stack of iterators instead of recursion.
         fixed_up: list[Any] = []
-        for arg in args:
-            if arg is None:
-                continue
-            if isinstance(arg, (list, tuple)):
-                fixed_up.extend(cls._fixup_args(arg))
-            else:
+        stack: list[Iterator[Any]] = [iter(args)]
+        while stack:
+            for arg in stack[-1]:
+                if arg is None:
+                    continue
+                if isinstance(arg, (list, tuple)):
+                    stack.append(iter(arg))
+                    break
                 fixed_up.append(cls._fixup_arg(arg))
+            else:
+                stack.pop()
         return fixed_up
 
     @classmethod
@@ -331,11 +508,17 @@ class ToolRunner:
 
     @classmethod
     def _fixup_key(cls, key: str) -> str:
-        if key.startswith("-"):
-            return key
-        if len(key) == 1:
-            return f"-{key}"
-        return f"--{to_kebab(key)}"
+        return _option_key(key)
+
+
+@lru_cache(maxsize=1024)
+def _option_key(key: str) -> str:
+    # Convert a keyword argument name to a CLI option.
+    if key.startswith("-"):
+        return key
+    if len(key) == 1:
+        return f"-{key}"
+    return f"--{to_kebab(key)}"
 
 
 def deep_flatten(xs: Iterable[Any]) -> Iterable[Any]:
@@ -6,11 +6,13 @@
 from __future__ import annotations
 
 import os
+import sys
 from typing import (
     Any,
     Callable,
     Final,
     Generic,
+    KeysView,
     Optional,
     Protocol,
     Set,
@@ -65,6 +67,9 @@ class ValueProvider(Protocol[T_co]):
     value is available.  The ``has_value`` property can be used to check whether a value is available.
     """
 
+    # Allows implementations to use __slots__.
+    __slots__ = ()
+
     def get(self) -> T_co: ...
 
     @property
@@ -78,12 +83,42 @@ class ValueConsumer(Protocol[T_contra]):
     via the ``set()`` and ``unset()`` methods.
     """
 
+    # Allows implementations to use __slots__.
+    __slots__ = ()
+
     def set(self, value: T_contra) -> None: ...
 
     def unset(self) -> None: ...
 
 
-class ValueRef(Generic[T], ValueProvider[T], ValueConsumer[T]):
+class _ValueProviderBase:
+    # Concrete base of the value providers in this module. An ``isinstance`` check against it is much cheaper than
+    # against the ``runtime_checkable`` ``ValueProvider`` protocol.
+    __slots__ = ()
+
+
+# Common value types that never implement ``ValueProvider``.
+_PLAIN_TYPES: Final[frozenset[type]] = frozenset({str, int, float, bool, bytes, type(None), list, tuple, dict, set})
+
+
+def is_value_provider(value: Any) -> TypeGuard[ValueProvider[Any]]:
+    """
+    Check whether `value` implements the ``ValueProvider`` protocol. Providers defined in this module and common
+    plain values are recognised without the (slow) protocol check.
+
+    :param value: The value to check.
+    :returns: Whether `value` is a ``ValueProvider``.
+    """
+    if isinstance(value, _ValueProviderBase):
+        return True
+    if type(value) in _PLAIN_TYPES:
+        return False
+    return isinstance(value, ValueProvider)
+
+
+class ValueRef(_ValueProviderBase, Generic[T], ValueProvider[T], ValueConsumer[T]):
+    __slots__ = ("_value", "_name")
+
     def __init__(self, value: T | NoValueType = NoValue, name: str | None = None) -> None:
         """
         A read/write value container that implements the ``ValueProvider[T]`` and ``ValueConsumer[T]`` protocols.
@@ -102,16 +137,17 @@ class ValueRef(Generic[T], ValueProvider[T], ValueConsumer[T]):
         Get the value currently held by this instance. A ``NoValueError`` is raised if no value is present.
         :returns: The value held by this instance.
         """
-        if not self.has_value:
+        value: T | NoValueType = self._value
+        if value is NoValue:
             raise NoValueError(f"{repr(self)} has no value")
-        return cast(T, self._value)
+        return cast(T, value)
 
     @property
     def has_value(self) -> bool:
         """
         :returns: Whether this instance holds a value.
         """
-        return _is_value(self._value)
+        return self._value is not NoValue
 
     def set(self, value: T) -> None:
         """
@@ -172,21 +208,36 @@ class ValueRef(Generic[T], ValueProvider[T], ValueConsumer[T]):
         return self.value
 
 
-class MappedValueProvider(ValueProvider[U]):
+class MappedValueProvider(_ValueProviderBase, ValueProvider[U]):
+    __slots__ = ("_func", "_provider")
+
     def __init__(self, func: Callable[[T], U], provider: ValueProvider[T] | None = None) -> None:
         """
         A ``ValueProvider`` that transforms the value returned by another ``ValueProvider``.
         :param func: The transformation function.
         :provider: The provider that provides the value to transform.
         """
-        self._func: Callable[[T], U] = func
-        self._provider: ValueProvider[T] | None = provider
+        if type(provider) is MappedValueProvider:
+            # Fuse nested mappings so that get() goes straight to the innermost provider. Subclasses may override
+            # get()/has_value, so only exact instances are fused.
+            inner_func: Callable[[Any], T] = provider._func
+            inner_provider: ValueProvider[Any] | None = provider._provider
+
+            def fused(value: Any) -> U:
+                return func(inner_func(value))
+
+            self._func: Callable[[Any], U] = fused
+            self._provider: ValueProvider[Any] | None = inner_provider
+        else:
+            self._func = func
+            self._provider = provider
 
     def get(self) -> U:
         """:returns: The transformed value."""
-        if self._provider is None or not self.has_value:
+        provider: ValueProvider[Any] | None = self._provider
+        if provider is None or not provider.has_value:
             raise NoValueError(f"{repr(self)} has no value")
-        return self._func(self._provider.get())
+        return self._func(provider.get())
 
     @property
     def has_value(self) -> bool:
@@ -202,11 +253,13 @@ class MappedValueProvider(ValueProvider[U]):
         return f"{self.__class__.__name__}"
 
 
-class ComputedValue(ValueProvider[T]):
+class ComputedValue(_ValueProviderBase, ValueProvider[T]):
     """
     A `ValueProvider` that computes the value everytime `get()` is called.
     """
 
+    __slots__ = ("_func", "_name")
+
     def __init__(self, func: Callable[[], T], name: str | None = None) -> None:
         self._func: Callable[[], T] = func
         self._name = name
@@ -230,11 +283,13 @@ class ComputedValue(ValueProvider[T]):
         return f"{self.__class__.__name__}"
 
 
-class LazyValue(ValueProvider[T]):
+class LazyValue(_ValueProviderBase, ValueProvider[T]):
     """
     A `ValueProvider` that computes the value only the first time `get()` is called.
     """
 
+    __slots__ = ("_func", "_name", "_value")
+
     def __init__(self, func: Callable[[], T], name: str | None = None) -> None:
         self._func: Callable[[], T] = func
         self._name = name
@@ -245,11 +300,12 @@ class LazyValue(ValueProvider[T]):
         return self.get()
 
     def get(self) -> T:
-        if self._func is None:
-            raise NoValueError(f"{repr(self)} has no value")
-        if not _is_value(self._value):
-            self._value = self._func()
-        return self._value
+        value: T | NoValueType = self._value
+        if value is NoValue:
+            if self._func is None:
+                raise NoValueError(f"{repr(self)} has no value")
+            value = self._value = self._func()
+        return cast(T, value)
 
     @property
     def has_value(self) -> bool:
@@ -261,7 +317,9 @@ class LazyValue(ValueProvider[T]):
         return f"{self.__class__.__name__}"
 
 
-class EnvironmentVariable(ValueProvider[T_co]):
+class EnvironmentVariable(_ValueProviderBase, ValueProvider[T_co]):
+    __slots__ = ("_name", "_coercer", "_default")
+
     def __init__(self, name: str, coercer: Callable[[str], T_co], default: T_co | NoValueType = NoValue) -> None:
         """
         A type-safe ``ValueProvider`` that provides access to an environment variable.
@@ -275,14 +333,18 @@ class EnvironmentVariable(ValueProvider[T_co]):
         self._default: T_co | NoValueType = default
 
     def get(self) -> T_co:
-        value: Any = os.getenv(self._name, default=self._default)
-        if _is_value(value):
-            return self._coercer(value)
-        raise NoValueError(f"Environment variable '{self._name}' is not set.")
+        value: Any = self._lookup()
+        if value is NoValue:
+            raise NoValueError(f"Environment variable '{self._name}' is not set.")
+        return self._coercer(value)
 
     @property
     def has_value(self) -> bool:
-        return _is_value(os.getenv(self._name, default=self._default))
+        return self._lookup() is not NoValue
+
+    def _lookup(self) -> Any:
+        # os.environ.get() skips the os.getenv() wrapper.
+        return os.environ.get(self._name, self._default)
 
     def __repr__(self) -> str:
         value: str = f"environment_variable('{self._name}'"
@@ -295,16 +357,21 @@ class EnvironmentVariable(ValueProvider[T_co]):
 
 
 class ValueKey(Generic[T]):
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         """
         A typed key used to access values from a ``Values`` instance.
 
         :param name: The key name.
         """
-        self.name: str = name
+        # Interned so that dict probes in ``Values`` can match on identity.
+        self.name: str = sys.intern(name)
 
 
 class ValuesRef(ValueRef[T]):
+    __slots__ = ("_values", "_key", "_key_name", "_dict")
+
     def __init__(self, values: Values, key: ValueKey[T]) -> None:
         """
         A ``ValueRef`` class that is backed by a ``Values`` instance.
@@ -315,22 +382,44 @@ class ValuesRef(ValueRef[T]):
         super().__init__(name=key.name)
         self._values: Values = values
         self._key: ValueKey[T] = key
+        self._key_name: str = key.name
+        # A top-level key is read straight from the backing dict, which a ``Values`` instance never replaces.
+        self._dict: dict[str, Any] | None = None if "." in key.name else values._values
 
     def get(self) -> T:
-        return self._values.get(self._key)
+        if self._dict is None:
+            return self._values._get_name(self._key_name)
+        try:
+            return self._dict[self._key_name]
+        except KeyError:
+            raise NoValueError(f"{repr(self._values)} has no value associated with key '{self._key_name}'") from None
 
     @property
     def has_value(self) -> bool:
-        return self._values.has_value(self._key)
+        if self._dict is None:
+            return self._values._has_name(self._key_name)
+        return self._key_name in self._dict
 
     def set(self, value: T) -> None:
-        self._values.set(self._key, value)
+        self._values._set_name(self._key_name, value)
 
     def unset(self) -> None:
-        self._values.unset(self._key)
+        if self._dict is None:
+            self._values._unset_name(self._key_name)
+        else:
+            self._dict.pop(self._key_name, None)
+
+
+def _key_name(key: ValueKey[T] | str) -> str:
+    # Exact type check first; plain strings are by far the most common key.
+    if type(key) is str or not isinstance(key, ValueKey):
+        return key
+    return key.name
 
 
 class Values:
+    __slots__ = ("_values",)
+
     def __init__(self, **kwargs) -> None:
         """
         A wrapper around a ``dict[str, Any]`` that allows statically type-checked access
@@ -340,13 +429,20 @@ class Values:
         """
         self._values: dict[str, Any] = {}
         for key, value in kwargs.items():
-            self.set(key, value)
+            self._set_name(key, value)
 
-    def keys(self) -> Set[str]:
+    def keys(self) -> KeysView[str]:
         """
-        :returns: A snapshot of the current keys.
+        :returns: A live view of the current top-level keys. As with a ``dict``, this instance should not be modified
+         while iterating over the view.
         """
-        return set(self._values.keys())
+        return self._values.keys()
+
+    def snapshot_keys(self) -> Set[str]:
+        """
+        :returns: A snapshot of the current top-level keys.
+        """
+        return set(self._values)
 
     def get(self, key: ValueKey[T] | str) -> T:
         """
@@ -356,25 +452,13 @@ class Values:
         :param key: A `ValueKey` or `str` key.
         :returns: A value of type `T`.
         """
-        if isinstance(key, ValueKey):
-            key = key.name
-        nested_key: str | None
-        nested_dict: dict[str, Any] | None
-        nested_key, nested_dict = self._get_nested_key_and_dict(key)
-        if nested_key is None or nested_dict is None:
-            raise NoValueError(f"{repr(self)} has no value associated with key '{key}'")
-        return nested_dict[nested_key]
+        return self._get_name(_key_name(key))
 
     def has_value(self, key: ValueKey[T] | str) -> bool:
         """
         Check whether the provided *key*
         """
-        if isinstance(key, ValueKey):
-            key = key.name
-        nested_key: str | None
-        nested_dict: dict[str, Any] | None
-        nested_key, nested_dict = self._get_nested_key_and_dict(key)
-        return nested_key is not None and nested_dict is not None
+        return self._has_name(_key_name(key))
 
     def set(self, key: ValueKey[T] | str, value: ValueOrRef[T]) -> None:
         """
@@ -383,22 +467,7 @@ class Values:
         :param key: The key to associate the value with.
         :param value: The value to add to this ``Values`` instance.
         """
-        if isinstance(key, ValueKey):
-            key = key.name
-        if isinstance(value, ValueProvider):
-            if value.has_value:
-                value = value.get()
-            else:
-                value = NoValue  # type: ignore[assignment]
-
-        if not _is_value(value):
-            self.unset(key)
-        else:
-            nested_key: str | None
-            nested_dict: dict[str, Any] | None
-            nested_key, nested_dict = self._get_nested_key_and_dict(key, create_missing=True)
-            assert nested_key and nested_dict
-            nested_dict[nested_key] = value
+        self._set_name(_key_name(key), value)
 
     def unset(self, key: ValueKey[T] | str) -> None:
         """
@@ -406,13 +475,7 @@ class Values:
 
         :param key: The key associated with the value to remove.
         """
-        if isinstance(key, ValueKey):
-            key = key.name
-        nested_key: str | None
-        nested_dict: dict[str, Any] | None
-        nested_key, nested_dict = self._get_nested_key_and_dict(key, create_missing=True)
-        if nested_key is not None and nested_dict is not None:
-            nested_dict.pop(nested_key)
+        self._unset_name(_key_name(key))
 
     def get_or_else(self, key: ValueKey[T] | str, default: T | None = None) -> T | None:
         """
@@ -421,7 +484,8 @@ class Values:
         :param default: The default value to return if no value is present.
         :returns: The value of `default`.
         """
-        return self.get(key) if self.has_value(key) else default
+        name: str = _key_name(key)
+        return self._get_name(name) if self._has_name(name) else default
 
     def get_ref(self, key: ValueKey[T] | str) -> ValueRef[T]:
         """
@@ -434,6 +498,53 @@ class Values:
             key = ValueKey[T](key)
         return ValuesRef(self, key)
 
+    def _get_name(self, name: str) -> Any:
+        if "." not in name:
+            # Top-level key: a single dict lookup.
+            try:
+                return self._values[name]
+            except KeyError:
+                raise NoValueError(f"{repr(self)} has no value associated with key '{name}'") from None
+        nested_key: str | None
+        nested_dict: dict[str, Any] | None
+        nested_key, nested_dict = self._get_nested_key_and_dict(name)
+        if nested_key is None or nested_dict is None:
+            raise NoValueError(f"{repr(self)} has no value associated with key '{name}'")
+        return nested_dict[nested_key]
+
+    def _has_name(self, name: str) -> bool:
+        if "." not in name:
+            return name in self._values
+        nested_key: str | None
+        nested_dict: dict[str, Any] | None
+        nested_key, nested_dict = self._get_nested_key_and_dict(name)
+        return nested_key is not None and nested_dict is not None
+
+    def _set_name(self, name: str, value: Any) -> None:
+        if is_value_provider(value):
+            value = value.get() if value.has_value else NoValue
+
+        if not _is_value(value):
+            self._unset_name(name)
+        elif "." not in name:
+            self._values[sys.intern(name)] = value
+        else:
+            nested_key: str | None
+            nested_dict: dict[str, Any] | None
+            nested_key, nested_dict = self._get_nested_key_and_dict(name, create_missing=True)
+            assert nested_key and nested_dict
+            nested_dict[nested_key] = value
+
+    def _unset_name(self, name: str) -> None:
+        if "." not in name:
+            self._values.pop(name, None)
+            return
+        nested_key: str | None
+        nested_dict: dict[str, Any] | None
+        nested_key, nested_dict = self._get_nested_key_and_dict(name)
+        if nested_key is not None and nested_dict is not None:
+            nested_dict.pop(nested_key, None)
+
     def _get_nested_key_and_dict(
         self, key: str, create_missing: bool = False
     ) -> tuple[str | None, dict[str, Any] | None]:
@@ -469,8 +580,9 @@ ValueOrRef: TypeAlias = ValueProvider[T] | T
 def as_value_ref(value_or_ref: ValueOrRef[T] | None, name: str | None = None) -> ValueRef[T]:
     if isinstance(value_or_ref, ValueRef):
         return value_or_ref
-    value: T | None = cast(T | None, value_or_ref)
-    return ValueRef(NoValue if value is None else value, name=name)
+    if value_or_ref is None:
+        return ValueRef(name=name)
+    return ValueRef(cast(T, value_or_ref), name=name)
 
 
 def get_ref_value(value_or_ref: ValueOrRef[T], default: Optional[T] = None) -> Optional[T]:
@@ -5,9 +5,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_left
 from enum import Enum, auto
-from typing import ClassVar, Final, Generic, Iterable, TextIO, TypeVar
+from functools import lru_cache
+from io import TextIOBase
+from time import monotonic_ns
+from typing import ClassVar, Final, Generic, Iterable, TextIO, TypeVar, cast
 
 from rkojob import JobException, JobScope, JobStatus
 
@@ -22,7 +25,38 @@ class JobStatusWriterPair(Enum):
 T = TypeVar("T")
 
 
+# Indents are cached per depth, as the same few depths are written repeatedly.
+@lru_cache(maxsize=64)
+def _heading_indent(depth: int) -> str:
+    return "#" * (depth + 1) + " "
+
+
+@lru_cache(maxsize=64)
+def _pad(depth: int) -> str:
+    return "  " * depth
+
+
+@lru_cache(maxsize=64)
+def _item_indent(depth: int) -> str:
+    return _pad(depth) + " - "
+
+
+@lru_cache(maxsize=64)
+def _separator(prefix: str, prev_suffix: str) -> str:
+    # What to write between an event with suffix prev_suffix and an event with prefix.
+    if prev_suffix.endswith(prefix):
+        return ""
+    return prefix.removeprefix(prev_suffix)
+
+
+@lru_cache(maxsize=64)
+def _item_finish_indent(depth: int) -> str:
+    return "   " * depth
+
+
 class JobStatusWriterEvent(Generic[T]):
+    __slots__ = ("event", "start_ns")
+
     pair_type: ClassVar[JobStatusWriterPair | None] = None
     is_start: ClassVar[bool] = False
     prefix: ClassVar[str] = "\n\n"
@@ -31,52 +65,55 @@ class JobStatusWriterEvent(Generic[T]):
     def __init__(
         self,
         event: T,
-        start: datetime | None = None,
+        start_ns: int | None = None,
     ):
         self.event: T = event
-        self.start: datetime | None = start
+        # Monotonic start time in nanoseconds, if the duration should be reported.
+        self.start_ns: int | None = start_ns
 
     def write_event(
         self,
         stream: TextIO,
         depth: int = 0,
         prev_event: JobStatusWriterEvent | None = None,
-        duration: timedelta | None = None,
+        duration_ns: int | None = None,
     ) -> None:
-        self._write_prefix(stream, prev_event=prev_event)
-        self._write_indent(stream, depth, prev_event=prev_event)
-        self._write_event(stream, depth, duration=None if self.is_start else duration)
-        self._write_suffix(stream)
-
-    def _write_prefix(self, stream: TextIO, prev_event: JobStatusWriterEvent | None) -> None:
-        if not prev_event:
+        # Assemble the event and write it to the stream in a single call.
+        parts: list[str] = []
+        self._write_prefix(parts, prev_event=prev_event)
+        self._write_indent(parts, depth, prev_event=prev_event)
+        self._write_event(parts, depth, duration_ns=duration_ns)
+        self._write_suffix(parts)
+        stream.write("".join(parts))
+
+    def _write_prefix(self, parts: list[str], prev_event: JobStatusWriterEvent | None) -> None:
+        if not prev_event or prev_event.suffix == self.prefix:
             return
-        if not prev_event.suffix.endswith(self.prefix):
-            separator: str = self.prefix.removeprefix(prev_event.suffix)
-            stream.write(separator)
+        separator: str = _separator(self.prefix, prev_event.suffix)
+        if separator:
+            parts.append(separator)
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
         pass
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(str(self.event))
-        self._write_duration(stream, duration=duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(str(self.event))
+        self._write_duration(parts, duration_ns=duration_ns)
 
-    def _write_duration(self, stream: TextIO, duration: timedelta | None) -> None:
-        if duration:
-            stream.write(f" ({self._format_duration(duration)})")
+    def _write_duration(self, parts: list[str], duration_ns: int | None) -> None:
+        if duration_ns:
+            parts.append(f" ({self._format_duration(duration_ns)})")
 
-    def _write_suffix(self, stream: TextIO) -> None:
-        stream.write(self.suffix)
+    def _write_suffix(self, parts: list[str]) -> None:
+        parts.append(self.suffix)
 
     @staticmethod
-    def _format_duration(duration: timedelta) -> str:
+    def _format_duration(duration_ns: int) -> str:
         # 12h34m56.123s
-        millis = int(duration.microseconds / 1000)
-        seconds = duration.seconds
+        seconds, nanos = divmod(duration_ns, 1_000_000_000)
+        millis = nanos // 1_000_000
         minutes, seconds = divmod(seconds, 60)
         hours, minutes = divmod(minutes, 60)
-        hours += duration.days * 24
         if hours != 0:
             return f"{hours}h{minutes}m"
         if minutes != 0:
@@ -89,150 +126,176 @@ class JobStatusWriterEvent(Generic[T]):
 
 
 class ScopeStartEvent(JobStatusWriterEvent[JobScope]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.SCOPE
     is_start = True
 
-    def __init__(self, scope: JobScope, start: datetime | None = None) -> None:
-        super().__init__(scope, start=start)
+    def __init__(self, scope: JobScope, start_ns: int | None = None) -> None:
+        super().__init__(scope, start_ns=start_ns)
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("#" + "#" * depth + " ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append(_heading_indent(depth))
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"{self.event.type} {self.event.name}")
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"{self.event.type} {self.event.name}")
 
 
 class ScopeFinishEvent(JobStatusWriterEvent[JobScope]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.SCOPE
 
     def __init__(self, scope: JobScope) -> None:
         super().__init__(scope)
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("\u2705 ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append("\u2705 ")
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"Finished **{self.event.type} {self.event.name}**")
-        self._write_duration(stream, duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"Finished **{self.event.type} {self.event.name}**")
+        self._write_duration(parts, duration_ns)
 
 
 class ScopeFinishErrorEvent(JobStatusWriterEvent[JobScope]):
+    __slots__ = ("error",)
+
     pair_type = JobStatusWriterPair.SCOPE
 
     def __init__(self, scope: JobScope, error: str | Exception) -> None:
         super().__init__(scope)
         self.error: str | Exception = error
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("\u274c ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append("\u274c ")
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"Finished **{self.event.type} {self.event.name}**")
-        self._write_duration(stream, duration)
-        stream.write(f"\n\u274c {self.error}")
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"Finished **{self.event.type} {self.event.name}**")
+        self._write_duration(parts, duration_ns)
+        parts.append(f"\n\u274c {self.error}")
 
 
 class ScopeFinishErrorsEvent(JobStatusWriterEvent[JobScope]):
+    __slots__ = ("errors",)
+
     pair_type = JobStatusWriterPair.SCOPE
 
     def __init__(self, scope: JobScope, errors: list[str | Exception]) -> None:
         super().__init__(scope)
         self.errors: list[str | Exception] = errors
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("\u274c ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append("\u274c ")
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"Finished **{self.event.type} {self.event.name}**")
-        self._write_duration(stream, duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"Finished **{self.event.type} {self.event.name}**")
+        self._write_duration(parts, duration_ns)
         for error in self.errors:
-            stream.write(f"\n - \u274c {error}")
+            parts.append(f"\n - \u274c {error}")
 
 
 class ScopeSkippedEvent(JobStatusWriterEvent[JobScope]):
+    __slots__ = ("reason",)
+
     def __init__(self, scope: JobScope, reason: str | None = None) -> None:
         super().__init__(scope)
         self.reason: str | None = reason
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"**Skipping {self.event.type} {self.event.name}")
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"**Skipping {self.event.type} {self.event.name}")
         if self.reason:
-            stream.write(f" ({self.reason})")
-        stream.write("**")
+            parts.append(f" ({self.reason})")
+        parts.append("**")
 
 
 class SectionStartEvent(JobStatusWriterEvent[str]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.SECTION
     is_start = True
 
-    def __init__(self, name: str, start: datetime | None = None) -> None:
-        super().__init__(name, start=start)
+    def __init__(self, name: str, start_ns: int | None = None) -> None:
+        super().__init__(name, start_ns=start_ns)
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("#" + "#" * depth + " ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append(_heading_indent(depth))
+
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        # Start events never report a duration.
+        parts.append(str(self.event))
 
 
 class SectionFinishEvent(JobStatusWriterEvent[str]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.SECTION
 
     def __init__(self, name: str) -> None:
         super().__init__(name)
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"Finished **{self.event}**")
-        self._write_duration(stream, duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"Finished **{self.event}**")
+        self._write_duration(parts, duration_ns)
 
 
 class SectionFinishErrorEvent(JobStatusWriterEvent[str]):
+    __slots__ = ("error",)
+
     pair_type = JobStatusWriterPair.SECTION
 
     def __init__(self, name: str, error: str | Exception) -> None:
         super().__init__(name)
         self.error: str | Exception = error
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("\u274c ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append("\u274c ")
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"Finished **{self.event}**")
-        self._write_duration(stream, duration)
-        stream.write(f"\n\u274c {self.error}")
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"Finished **{self.event}**")
+        self._write_duration(parts, duration_ns)
+        parts.append(f"\n\u274c {self.error}")
 
 
 class SectionFinishErrorsEvent(JobStatusWriterEvent[str]):
+    __slots__ = ("errors",)
+
     pair_type = JobStatusWriterPair.SECTION
 
     def __init__(self, name: str, errors: list[str | Exception]) -> None:
         super().__init__(name)
         self.errors: list[str | Exception] = errors
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("\u274c ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append("\u274c ")
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"\u274c Finished **{self.event}**")
-        self._write_duration(stream, duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"\u274c Finished **{self.event}**")
+        self._write_duration(parts, duration_ns)
         for error in self.errors:
-            stream.write(f"\n\u274c {error}")
+            parts.append(f"\n\u274c {error}")
 
 
 class ItemStartEvent(JobStatusWriterEvent[str]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.ITEM
     is_start = True
     prefix = "\n"
     suffix = ""
 
-    def __init__(self, event: str, start: datetime | None = None) -> None:
-        super().__init__(event, start=start)
+    def __init__(self, event: str, start_ns: int | None = None) -> None:
+        super().__init__(event, start_ns=start_ns)
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
-        stream.write("  " * depth + " - ")
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+        parts.append(_item_indent(depth))
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"{self.event}...")
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"{self.event}...")
 
 
 class ItemFinishEvent(JobStatusWriterEvent[str]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.ITEM
     prefix = ""
     suffix = "\n"
@@ -240,12 +303,14 @@ class ItemFinishEvent(JobStatusWriterEvent[str]):
     def __init__(self, outcome: str = "done.") -> None:
         super().__init__(outcome)
 
-    def _write_indent(self, stream: TextIO, depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
+    def _write_indent(self, parts: list[str], depth: int, prev_event: JobStatusWriterEvent | None = None) -> None:
         if not isinstance(prev_event, ItemStartEvent):
-            stream.write("   " * depth)
+            parts.append(_item_finish_indent(depth))
 
 
 class ItemFinishErrorEvent(JobStatusWriterEvent[str | Exception]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.ITEM
     prefix = ""
     suffix = "\n"
@@ -253,12 +318,14 @@ class ItemFinishErrorEvent(JobStatusWriterEvent[str | Exception]):
     def __init__(self, error: str | Exception) -> None:
         super().__init__(error)
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"\u274c {self.event}")
-        self._write_duration(stream, duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"\u274c {self.event}")
+        self._write_duration(parts, duration_ns)
 
 
 class ItemFinishErrorsEvent(JobStatusWriterEvent[list[str | Exception]]):
+    __slots__ = ()
+
     pair_type = JobStatusWriterPair.ITEM
     prefix = ""
     suffix = "\n"
@@ -266,50 +333,101 @@ class ItemFinishErrorsEvent(JobStatusWriterEvent[list[str | Exception]]):
     def __init__(self, errors: list[str | Exception]) -> None:
         super().__init__(errors)
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write("\u274c")
-        self._write_duration(stream, duration)
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append("\u274c")
+        self._write_duration(parts, duration_ns)
+        pad: str = _pad(depth)
         for error in self.event:
-            stream.write(f"\n{'  ' * depth} - \u274c {error}")
+            parts.append(f"\n{pad} - \u274c {error}")
 
 
 class MessageEvent(JobStatusWriterEvent[str]):
+    __slots__ = ()
+
     def __init__(self, message: str) -> None:
         super().__init__(message)
 
 
 class ErrorEvent(JobStatusWriterEvent[str | Exception]):
+    __slots__ = ()
+
     def __init__(self, error: str | Exception) -> None:
         super().__init__(error)
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
-        stream.write(f"\u274c {self.event}")
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
+        parts.append(f"\u274c {self.event}")
 
 
 class OutputEvent(JobStatusWriterEvent[str | Iterable[str]]):
+    __slots__ = ("label", "_collapsible")
+
     def __init__(self, output: str | Iterable[str], label: str, collapsible: bool = False) -> None:
         super().__init__(output)
         self.label: str = label
         self._collapsible: bool = collapsible
 
-    def _write_event(self, stream: TextIO, depth: int, duration: timedelta | None = None) -> None:
+    def _write_event(self, parts: list[str], depth: int, duration_ns: int | None = None) -> None:
         if self._collapsible:
-            stream.write("<details>\n")
-            stream.write(f"<summary>{self.label}</summary>\n")
+            parts.append("<details>\n")
+            parts.append(f"<summary>{self.label}</summary>\n")
         else:
-            stream.write(f"{self.label}:\n")
+            parts.append(f"{self.label}:\n")
 
         output: str | Iterable[str] = self.event
         if isinstance(output, str):
             output = [output]
-        for line in output:
-            if line.endswith("\n"):
-                line = line[:-1]
-            for subline in line.split("\n"):
-                stream.write(f"\n    {subline}")
+        # Drop a single trailing newline from each line, then indent the whole block at once.
+        lines: list[str] = [line.removesuffix("\n") for line in output]
+        if lines:
+            parts.append("\n    " + "\n".join(lines).replace("\n", "\n    "))
 
         if self._collapsible:
-            stream.write("\n\n</details>")
+            parts.append("\n\n</details>")
+
+
+class BufferedStatusSink(TextIOBase):
+    """
+    Wraps a stream so that the first few writes are written and flushed immediately and later writes are
+    batched until *flush_chars* characters are buffered or the sink is flushed.
+
+    Flushing also restarts the count of immediate writes, so output after a pause is not held back.
+    """
+
+    def __init__(self, stream: TextIO, start_batching_after: int = 4, flush_chars: int = 8192) -> None:
+        super().__init__()
+        self._stream: TextIO = stream
+        self._start_batching_after: int = start_batching_after
+        self._flush_chars: int = flush_chars
+        self._buffer: list[str] = []
+        self._buffered_chars: int = 0
+        self._immediate_writes: int = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if self._immediate_writes < self._start_batching_after:
+            self._immediate_writes += 1
+            self._stream.write(text)
+            self._stream.flush()
+        else:
+            self._buffer.append(text)
+            self._buffered_chars += len(text)
+            if self._buffered_chars >= self._flush_chars:
+                self._write_buffer()
+                self._stream.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        self._write_buffer()
+        self._stream.flush()
+        self._immediate_writes = 0
+
+    def _write_buffer(self) -> None:
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_chars = 0
 
 
 class JobStatusWriter(JobStatus):
@@ -321,47 +439,61 @@ class JobStatusWriter(JobStatus):
         stream: TextIO,
         show_detail: bool = True,
         collapsible_output: bool = False,
+        buffered: bool = False,
     ) -> None:
+        """
+        :param stream: The stream to write status to.
+        :param show_detail: Write detail messages.
+        :param collapsible_output: Write output in collapsible blocks.
+        :param buffered: Batch writes to *stream* using a `BufferedStatusSink`, flushing when the outermost scope
+         finishes. Leave unset if other output is written to the same stream directly.
+        """
         self._show_detail: bool = show_detail
         self._collapsible_output: bool = collapsible_output
-        self._stream: TextIO = stream
+        self._stream: TextIO = cast(TextIO, BufferedStatusSink(stream)) if buffered else stream
+        self._buffered: bool = buffered
         self._event_stack: list[JobStatusWriterEvent] = []
+        # Unfinished start events of each pair type, with their index in the event stack.
+        self._start_stack_by_pair: dict[JobStatusWriterPair, list[tuple[JobStatusWriterEvent, int]]] = {
+            pair: [] for pair in JobStatusWriterPair
+        }
+        # Index in the event stack of each error event.
+        self._error_indexes: list[int] = []
 
     def _write_event_and_append(self, event: JobStatusWriterEvent) -> None:
         prev_event: JobStatusWriterEvent | None = self._event_stack[-1] if self._event_stack else None
-        duration: timedelta | None = None
+        duration_ns: int | None = None
         if event.pair_type is not None and not event.is_start:
             start_event: JobStatusWriterEvent = self._find_start_event(type(event))
-            if start_event.start:
-                duration = datetime.now() - start_event.start
+            if start_event.start_ns is not None:
+                duration_ns = monotonic_ns() - start_event.start_ns
         depth: int
         if event.pair_type in (JobStatusWriterPair.SCOPE, JobStatusWriterPair.SECTION):
             depth = self._depth(ScopeStartEvent) + self._depth(SectionStartEvent)
         else:
             depth = self._depth(type(event))
-        event.write_event(self._stream, depth=depth, prev_event=prev_event, duration=duration)
+        event.write_event(self._stream, depth=depth, prev_event=prev_event, duration_ns=duration_ns)
+        self._append_event(event)
+
+    def _append_event(self, event: JobStatusWriterEvent) -> None:
+        index: int = len(self._event_stack)
         self._event_stack.append(event)
+        if event.pair_type is not None:
+            if event.is_start:
+                self._start_stack_by_pair[event.pair_type].append((event, index))
+            else:
+                self._start_stack_by_pair[event.pair_type].pop()
+        elif isinstance(event, ErrorEvent):
+            self._error_indexes.append(index)
 
     def _depth(self, event_type: type[JobStatusWriterEvent]) -> int:
         if event_type.pair_type is None:
             # Event type does not have nesting
             return 0
-
-        depth: int = 0
-        for event in self._event_stack:
-            if event.pair_type != event_type.pair_type:
-                # Not a related event
-                continue
-            if event.is_start:
-                # Start event
-                depth += 1
-            else:
-                # finish event
-                depth -= 1
-        return depth
+        return len(self._start_stack_by_pair[event_type.pair_type])
 
     def start_scope(self, scope: JobScope, include_duration: bool = True) -> None:
-        self._write_event_and_append(ScopeStartEvent(scope, start=datetime.now() if include_duration else None))
+        self._write_event_and_append(ScopeStartEvent(scope, start_ns=monotonic_ns() if include_duration else None))
 
     def finish_scope(self, scope: JobScope | None = None) -> None:
         if scope is None:
@@ -375,12 +507,20 @@ class JobStatusWriter(JobStatus):
         else:
             event = ScopeFinishEvent(scope)
         self._write_event_and_append(event)
+        if self._buffered and not self._depth(ScopeFinishEvent):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Flush any buffered status to the stream.
+        """
+        self._stream.flush()
 
     def skip_scope(self, scope: JobScope, reason: str | None = None) -> None:
         self._write_event_and_append(ScopeSkippedEvent(scope, reason=reason))
 
     def start_section(self, name: str, include_duration: bool = True) -> None:
-        self._write_event_and_append(SectionStartEvent(name, start=datetime.now() if include_duration else None))
+        self._write_event_and_append(SectionStartEvent(name, start_ns=monotonic_ns() if include_duration else None))
 
     def finish_section(self, name: str | None = None) -> None:
         if name is None:
@@ -396,7 +536,7 @@ class JobStatusWriter(JobStatus):
         self._write_event_and_append(event)
 
     def start_item(self, event: str, include_duration: bool = False, dots: str = "...") -> None:
-        self._write_event_and_append(ItemStartEvent(event, start=datetime.now() if include_duration else None))
+        self._write_event_and_append(ItemStartEvent(event, start_ns=monotonic_ns() if include_duration else None))
 
     def finish_item(self, outcome: str = "done.", error: str | Exception | None = None) -> None:
         errors: list[str | Exception] = self._get_errors(ItemFinishEvent, include_children=False)
@@ -412,6 +552,10 @@ class JobStatusWriter(JobStatus):
     def info(self, message: str) -> None:
         self._write_event_and_append(MessageEvent(message))
 
+    @property
+    def detail_enabled(self) -> bool:
+        return self._show_detail
+
     def detail(self, message: str) -> None:
         if self._show_detail:
             self._write_event_and_append(
@@ -427,7 +571,7 @@ class JobStatusWriter(JobStatus):
         event: ErrorEvent = ErrorEvent(message)
         if self._depth(ItemFinishEvent) > 0:
             # Append but don't write the error. It will be written on finish_item()
-            self._event_stack.append(event)
+            self._append_event(event)
         else:
             self._write_event_and_append(event)
 
@@ -441,10 +585,16 @@ class JobStatusWriter(JobStatus):
             # Event type can't have nested events (yet)
             return []
 
-        start_event: JobStatusWriterEvent = self._find_start_event(event_type)
+        start_index: int = self._find_start(event_type)[1]
 
         errors: list[str | Exception] = []
-        start_index: int = self._event_stack.index(start_event)
+        if include_children:
+            first_error: int = bisect_left(self._error_indexes, start_index)
+            for index in self._error_indexes[first_error:]:
+                error: str | Exception = self._event_stack[index].event
+                errors.append(str(error) if not isinstance(error, Exception) else error)
+            return errors
+
         depth: int = 0
         for event in self._event_stack[start_index:]:
             # if event.type.pair_type == event_type.pair_type:
@@ -454,29 +604,24 @@ class JobStatusWriter(JobStatus):
                 else:
                     depth -= 1
 
-            if isinstance(event, ErrorEvent) and (include_children or depth == 1):
+            if isinstance(event, ErrorEvent) and depth == 1:
                 errors.append(str(event.event) if not isinstance(event.event, Exception) else event.event)
 
         return errors
 
     def _find_start_event(self, event_type: type[JobStatusWriterEvent]) -> JobStatusWriterEvent:
+        return self._find_start(event_type)[0]
+
+    def _find_start(self, event_type: type[JobStatusWriterEvent]) -> tuple[JobStatusWriterEvent, int]:
+        # Find the innermost unfinished start event for event_type and its index in the event stack.
         if event_type.pair_type is None:
             raise JobException("Event type does not have start/finish pairs.")
 
         if event_type.is_start:
             raise JobException("Event type is a start event.")
 
-        events: list[JobStatusWriterEvent] = []
-        for event in self._event_stack:
-            if event.pair_type != event_type.pair_type:
-                continue
-
-            if event.is_start:
-                events.append(event)
-            else:
-                events.pop()
-
-        if not events:
+        starts: list[tuple[JobStatusWriterEvent, int]] = self._start_stack_by_pair[event_type.pair_type]
+        if not starts:
             raise JobException("Did not find start event.")
 
-        return events[-1]
+        return starts[-1]
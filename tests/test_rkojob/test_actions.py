@@ -3,63 +3,94 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
-import shlex
+import os
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from typing import cast
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from rkojob import JobContext, JobException, ValueRef
+from rkojob import JobContext, JobException, ValueRef, actions
 from rkojob.actions import ShellAction, ToolActionBuilder, VerifyTestStructure
 from rkojob.factories import JobContextFactory
 from rkojob.util import ShellException, ShellResult
 
 
+class StubStatus:
+    # Records the status calls made by ShellAction; much cheaper to build than a MagicMock.
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def section(self, *args, **kwargs) -> AbstractContextManager:
+        self.calls.append(("section", args, kwargs))
+        return nullcontext()
+
+    def output(self, *args, **kwargs) -> None:
+        self.calls.append(("output", args, kwargs))
+
+    def error(self, *args, **kwargs) -> None:
+        self.calls.append(("error", args, kwargs))
+
+
 class TestShellAction(TestCase):
-    def make_context(self) -> JobContext:
-        context = MagicMock(spec=JobContext)
-        context.status.section = MagicMock()
-        context.status.output = MagicMock()
-        return context
-
-    @patch("rkojob.actions.Shell")
-    def test_success(self, mock_shell_cls):
+    def setUp(self) -> None:
+        patcher = patch.object(actions, "Shell")
+        self.mock_shell_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_context(self, status: StubStatus) -> JobContext:
+        return cast(JobContext, SimpleNamespace(status=status))
+
+    def test_success(self):
         shell_result = ShellResult(stdout="ok", stderr="", return_code=0)
-        mock_shell_cls.return_value = lambda *args: shell_result
+        self.mock_shell_cls.return_value = lambda *args: shell_result
 
-        context = self.make_context()
+        status = StubStatus()
+        context = self.make_context(status)
 
         sut = ShellAction("echo", "ok")
         sut.action(context)
 
-        expected_command = shlex.join(("echo", "ok"))
-        context.status.section.assert_called_once_with(f"Executing {expected_command}")
-        context.status.output.assert_called_once_with("ok", label="stdout")
+        self.assertEqual(
+            [
+                ("section", ("Executing echo ok",), {}),
+                ("output", ("ok",), {"label": "stdout"}),
+            ],
+            status.calls,
+        )
         self.assertEqual(shell_result, sut.result.get())
 
-    @patch("rkojob.actions.Shell")
-    def test_shell_exception(self, mock_shell_cls):
+    def test_shell_exception(self):
         result = ShellResult(stdout="", stderr="boom", return_code=99)
         exception = ShellException(result=result)
-        mock_shell_cls.return_value = MagicMock(side_effect=exception)
+        self.mock_shell_cls.return_value = MagicMock(side_effect=exception)
 
-        context = self.make_context()
+        status = StubStatus()
+        context = self.make_context(status)
         result_ref = ValueRef()
 
         sut = ShellAction("explode", result=result_ref)
         sut.action(context)
 
-        context.status.error.assert_called_once_with(exception)
-        context.status.output.assert_called_once_with("boom", label="stderr")
+        self.assertEqual(
+            [
+                ("section", ("Executing explode",), {}),
+                ("error", (exception,), {}),
+                ("output", ("boom",), {"label": "stderr"}),
+            ],
+            status.calls,
+        )
         self.assertEqual(result, result_ref.value)
 
-    @patch("rkojob.actions.Shell")
-    def test_shell_raise_on_error(self, mock_shell_cls):
+    def test_shell_raise_on_error(self):
         result = ShellResult(stdout="", stderr="boom", return_code=99)
         exception = ShellException(result=result)
-        mock_shell_cls.return_value = MagicMock(side_effect=exception)
+        self.mock_shell_cls.return_value = MagicMock(side_effect=exception)
 
-        context = self.make_context()
+        status = StubStatus()
+        context = self.make_context(status)
         result_ref = ValueRef()
 
         sut = ShellAction("explode", result=result_ref, raise_on_error=True)
@@ -67,26 +98,31 @@ class TestShellAction(TestCase):
             sut.action(context)
         self.assertEqual("boom", str(e.exception))
 
-        context.status.error.assert_not_called()
-        context.status.output.assert_called_once_with("boom", label="stderr")
+        self.assertEqual(
+            [
+                ("section", ("Executing explode",), {}),
+                ("output", ("boom",), {"label": "stderr"}),
+            ],
+            status.calls,
+        )
         self.assertEqual(result, result_ref.value)
 
-    @patch("rkojob.actions.Shell")
-    def test_result_is_none(self, mock_shell_cls):
-        mock_shell_cls.return_value = lambda *args: None
+    def test_result_is_none(self):
+        self.mock_shell_cls.return_value = lambda *args: None
 
-        context = self.make_context()
+        status = StubStatus()
+        context = self.make_context(status)
         result_ref = ValueRef()
 
         action = ShellAction("nothing", result=result_ref)
         action.action(context)
 
-        context.status.output.assert_not_called()
+        self.assertEqual([("section", ("Executing nothing",), {})], status.calls)
         self.assertFalse(result_ref.has_value)
 
 
 class TestToolActionBuilder(TestCase):
-    @patch("rkojob.actions.Shell")
+    @patch.object(actions, "Shell")
     def test(self, mock_shell_type) -> None:
         sut = ToolActionBuilder("tool").command.sub_command("-v", enable_feature=True, keyword_arg="value")
         self.assertIsInstance(sut, ShellAction)
@@ -97,6 +133,13 @@ class TestToolActionBuilder(TestCase):
 
 
 class TestVerifyTestStructure(TestCase):
+    sut: VerifyTestStructure
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The helper methods under test don't depend on instance state.
+        cls.sut = VerifyTestStructure(src_path=Path("src"), tests_path=Path("tests"))
+
     def test(self) -> None:
         with TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -126,6 +169,25 @@ class TestVerifyTestStructure(TestCase):
                 ["Test path for source path 'foo/baz.py' not found: test_foo/test_baz.py"], sut.errors.value
             )
 
+    def test_scandir(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            foo_bar_path = temp_path / "src" / "foo" / "bar"
+            foo_bar_path.mkdir(parents=True)
+            (foo_bar_path / "baz.py").touch()
+
+            test_foo_bar_path = temp_path / "tests" / "test_foo" / "test_bar"
+            test_foo_bar_path.mkdir(parents=True)
+            (test_foo_bar_path / "test_baz.py").touch()
+
+            sut = VerifyTestStructure(src_path=temp_path / "src", tests_path=temp_path / "tests")
+            with patch("rkojob.actions.os.scandir", wraps=os.scandir) as mock_scandir:
+                sut.action(JobContextFactory.create())
+            # One scan per source directory: src, src/foo, src/foo/bar.
+            self.assertEqual(3, mock_scandir.call_count)
+            self.assertEqual([], sut.errors.value)
+
     def test_src_not_dir(self) -> None:
         sut = VerifyTestStructure(src_path=Path() / "foo.bar", tests_path=Path())
         with self.assertRaises(JobException) as e:
@@ -139,29 +201,24 @@ class TestVerifyTestStructure(TestCase):
         self.assertEqual("tests_path must be a directory: foo.bar", str(e.exception))
 
     def test_skip(self) -> None:
-        sut = VerifyTestStructure(src_path=MagicMock(), tests_path=MagicMock())
-        self.assertTrue(sut._skip(Path(".DS_Store")))
-        self.assertTrue(sut._skip(Path(".gitignore")))
-        self.assertTrue(sut._skip(Path("__pycache__")))
-        self.assertTrue(sut._skip(Path() / "Foo.egg-info"))
-        self.assertFalse(sut._skip(Path() / "foo.py"))
+        self.assertTrue(self.sut._skip(Path(".DS_Store")))
+        self.assertTrue(self.sut._skip(Path(".gitignore")))
+        self.assertTrue(self.sut._skip(Path("__pycache__")))
+        self.assertTrue(self.sut._skip(Path() / "Foo.egg-info"))
+        self.assertFalse(self.sut._skip(Path() / "foo.py"))
 
     def test_expected_test_path(self) -> None:
         src_path = Path("src")
         tests_path = Path("tests")
-        sut = VerifyTestStructure(src_path=src_path, tests_path=tests_path)
-
-        self.assertEqual(tests_path / "test_foo.py", sut._expected_test_path(src_path, tests_path, src_path / "foo.py"))
-        self.assertEqual(
-            tests_path / "test_foo" / "test_foo.py",
-            sut._expected_test_path(src_path, tests_path, src_path / "foo" / "__init__.py"),
-        )
-        self.assertEqual(
-            tests_path / "test_foo" / "test_bar.py",
-            sut._expected_test_path(src_path, tests_path, src_path / "foo" / "bar.py"),
-        )
+        cases: list[tuple[Path, Path]] = [
+            (src_path / "foo.py", tests_path / "test_foo.py"),
+            (src_path / "foo" / "__init__.py", tests_path / "test_foo" / "test_foo.py"),
+            (src_path / "foo" / "bar.py", tests_path / "test_foo" / "test_bar.py"),
+        ]
+        for source_path, expected in cases:
+            with self.subTest(source_path=str(source_path)):
+                self.assertEqual(expected, self.sut._expected_test_path(src_path, tests_path, source_path))
 
     def test_test_name(self) -> None:
-        sut = VerifyTestStructure(src_path=MagicMock(), tests_path=MagicMock())
-        self.assertEqual("test_foo.py", sut._test_name(Path("foo.py")))
-        self.assertEqual("test_foo.py", sut._test_name(Path("foo") / "__init__.py"))
+        self.assertEqual("test_foo.py", self.sut._test_name(Path("foo.py")))
+        self.assertEqual("test_foo.py", self.sut._test_name(Path("foo") / "__init__.py"))
@@ -18,8 +18,21 @@ from rkojob import JobException
 from rkojob.cli import Cli
 from rkojob.writer import JobStatusWriter
 
+# Use libyaml when PyYAML was built with it.
+_YAML_DUMPER: type = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class TestCli(TestCase):
+    temp_dir: tempfile.TemporaryDirectory
+    yaml_files: dict[str, Path]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One directory per class; YAML files are written once per distinct content.
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.temp_dir.cleanup)
+        cls.yaml_files = {}
+
     def setUp(self) -> None:  # runs before each test
         self.sut = Cli()
 
@@ -62,8 +75,12 @@ class TestCli(TestCase):
         self.assertEqual(self.sut.success(), 0)
 
     def _write_yaml(self, content: Any) -> Path:
-        path = Path(tempfile.mkstemp(suffix=".yml")[1])
-        path.write_text(yaml.safe_dump(content), encoding="utf-8")
+        text: str = yaml.dump(content, Dumper=_YAML_DUMPER)
+        path: Path | None = self.yaml_files.get(text)
+        if path is None:
+            path = Path(self.temp_dir.name) / f"values{len(self.yaml_files)}.yml"
+            path.write_text(text, encoding="utf-8")
+            self.yaml_files[text] = path
         return path
 
     def test_load_values_from_file_success(self) -> None:
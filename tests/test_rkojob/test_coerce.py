@@ -4,19 +4,62 @@
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 from unittest import TestCase
 
 from rkojob.coerce import as_bool, as_float, as_int, as_path, as_str
 
+# Case tables are built once at import.
+_BOOL_CASES: tuple[tuple[Any, bool], ...] = (
+    ("true", True),
+    ("True", True),
+    ("1", True),
+    ("yes", True),
+    ("on", True),
+    (True, True),
+    (1, True),
+    ("false", False),
+    ("False", False),
+    ("FALSE", False),
+    ("0", False),
+    ("no", False),
+    ("off", False),
+    (False, False),
+    (0, False),
+)
+_BOOL_INVALID: tuple[Any, ...] = ("maybe", "", None, 42, 2, 1.0, 0.0, object())
+
+_INT_CASES: tuple[tuple[Any, int], ...] = (
+    (42, 42),
+    ("42", 42),
+    (" 42 ", 42),
+    (42.0, 42),
+)
+_INT_INVALID: tuple[Any, ...] = ("3.14", "foo", None, object())
+
+_FLOAT_CASES: tuple[tuple[Any, float], ...] = (
+    (3.14, 3.14),
+    ("3.14", 3.14),
+    (" 2.0 ", 2.0),
+    (2, 2.0),
+)
+_FLOAT_INVALID: tuple[Any, ...] = ("NaNish", None, object())
+
+_STR_CASES: tuple[tuple[Any, str], ...] = (
+    ("foo", "foo"),
+    (42, "42"),
+    (3.14, "3.14"),
+    (True, "True"),
+)
+
 
 class CoercionTest(TestCase):
-    def assertCoerces(self, coercer: Callable[[Any], Any], cases: list[tuple[Any, Any]]) -> None:
+    def assertCoerces(self, coercer: Callable[[Any], Any], cases: Iterable[tuple[Any, Any]]) -> None:
         for val, expected in cases:
             with self.subTest(val=val):
                 self.assertEqual(coercer(val), expected)
 
-    def assertFails(self, func: Callable[[Any], Any], cases: list[Any]) -> None:
+    def assertFails(self, func: Callable[[Any], Any], cases: Iterable[Any]) -> None:
         for val in cases:
             with self.subTest(val=val):
                 with self.assertRaises(ValueError):
@@ -24,79 +67,35 @@ class CoercionTest(TestCase):
 
 
 class TestAsBool(CoercionTest):
-    def test_true_values(self) -> None:
-        self.assertCoerces(
-            as_bool, [("true", True), ("True", True), ("1", True), ("yes", True), ("on", True), (True, True)]
-        )
-
-    def test_false_values(self) -> None:
-        self.assertCoerces(
-            as_bool,
-            [
-                ("false", False),
-                ("False", False),
-                ("FALSE", False),
-                ("0", False),
-                ("no", False),
-                ("off", False),
-                (False, False),
-            ],
-        )
+    def test_valid_values(self) -> None:
+        self.assertCoerces(as_bool, _BOOL_CASES)
 
     def test_invalid_values(self) -> None:
-        self.assertFails(as_bool, ["maybe", "", None, 42, 1.0, 0.0, object()])
-
-    def test_integer_values(self) -> None:
-        self.assertCoerces(as_bool, [(1, True), (0, False)])
-        self.assertFails(as_bool, [2])
+        self.assertFails(as_bool, _BOOL_INVALID)
 
 
 class TestAsInt(CoercionTest):
     def test_valid_ints(self) -> None:
-        self.assertCoerces(
-            as_int,
-            [
-                (42, 42),
-                ("42", 42),
-                (" 42 ", 42),
-                (42.0, 42),
-            ],
-        )
+        self.assertCoerces(as_int, _INT_CASES)
 
     def test_invalid_ints(self) -> None:
-        self.assertFails(as_int, ["3.14", "foo", None, object()])
+        self.assertFails(as_int, _INT_INVALID)
 
 
 class TestAsFloat(CoercionTest):
     def test_valid_floats(self) -> None:
-        self.assertCoerces(
-            as_float,
-            [
-                (3.14, 3.14),
-                ("3.14", 3.14),
-                (" 2.0 ", 2.0),
-                (2, 2.0),
-            ],
-        )
+        self.assertCoerces(as_float, _FLOAT_CASES)
 
     def test_invalid_floats(self) -> None:
-        self.assertFails(as_float, ["NaNish", None, object()])
+        self.assertFails(as_float, _FLOAT_INVALID)
 
 
 class TestAsStr(CoercionTest):
     def test_valid_strs(self) -> None:
-        self.assertCoerces(
-            as_str,
-            [
-                ("foo", "foo"),
-                (42, "42"),
-                (3.14, "3.14"),
-                (True, "True"),
-            ],
-        )
+        self.assertCoerces(as_str, _STR_CASES)
 
     def test_none_value(self) -> None:
-        self.assertFails(as_str, [None])
+        self.assertFails(as_str, (None,))
 
 
 class TestAsPath(TestCase):
@@ -105,6 +104,7 @@ class TestAsPath(TestCase):
 
     def test_str(self) -> None:
         self.assertEqual(Path("/foo/bar"), as_path("/foo/bar"))
+        self.assertIs(as_path("/foo/bar"), as_path("/foo/bar"))
 
     def test_path(self) -> None:
         value = Path("/foo/bar")
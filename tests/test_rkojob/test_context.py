@@ -60,7 +60,12 @@ class TestJobScopeStatuses(TestCase):
         self.assertEqual(JobScopeStatus.SKIPPED, sut.get_status(mock_scope_2))
         self.assertEqual(JobScopeStatus.PASSED, sut.get_status(mock_scope_3))
 
+        self.assertFalse(sut.has_errors())
+        self.assertFalse(sut.has_errors(mock_scope_1))
         sut.error("error")
+        self.assertTrue(sut.has_errors())
+        self.assertTrue(sut.has_errors(mock_scope_1))
+        self.assertFalse(sut.has_errors(mock_scope_3))
         sut.finish_scope(mock_scope_1)
         self.assertEqual(JobScopeStatus.FAILED, sut.get_status(mock_scope_1))
         self.assertEqual(JobScopeStatus.SKIPPED, sut.get_status(mock_scope_2))
@@ -115,6 +120,33 @@ class TestJobContextImpl(TestCase):
             self.assertEqual(mock_scope, sut._state_stack[0].scope)
         self.assertEqual([], sut._state_stack)
 
+    def test_in_scope_error(self):
+        sut = JobContextImpl()
+        mock_scope = MagicMock()
+        with self.assertRaises(ValueError):
+            with sut.in_scope(mock_scope) as scope:
+                self.assertIs(mock_scope, scope)
+                raise ValueError()
+        self.assertEqual([], sut._state_stack)
+
+    def test_state_reused(self):
+        def callback(context):
+            pass
+
+        sut = JobContextImpl()
+        scope_1 = StubScope("scope_1", StubScopeType.STEP)
+        scope_2 = StubScope("scope_2", StubScopeType.STEP)
+
+        with sut.in_scope(scope_1):
+            state = sut._get_state(scope_1)
+            sut.add_teardown(scope_1, callback)
+
+        with sut.in_scope(scope_2):
+            self.assertIs(state, sut._get_state(scope_2))
+            self.assertIs(scope_2, state.scope)
+            self.assertIsNone(state._teardown)
+        self.assertEqual([state], sut._state_pool)
+
     def test_get_state(self):
         sut = JobContextImpl()
         with self.assertRaises(JobException) as e:
@@ -131,6 +163,11 @@ class TestJobContextImpl(TestCase):
             with sut.in_scope(mock_scope_2):
                 self.assertIs(mock_scope_2, sut._get_state(mock_scope_2_id).scope)
 
+            outer_state = sut._get_state(mock_scope_1)
+            with sut.in_scope(mock_scope_1):
+                self.assertIs(outer_state, sut._get_state(mock_scope_1))
+            self.assertIs(outer_state, sut._get_state(mock_scope_1))
+
             with self.assertRaises(JobException) as e:
                 _ = sut._get_state(mock_scope_2)
             self.assertEqual("No state found for scope 'Stage scope_2'", str(e.exception))
@@ -191,6 +228,7 @@ class TestJobContextImpl(TestCase):
                     self.assertIs(mock_scope_1, sut.get_scope(generation=2))
                     self.assertIs(mock_scope_1, sut.get_scope(generation=-1))
                     self.assertIs(mock_scope_2, sut.get_scope(generation=-2))
+                    self.assertIs(mock_scope_1, sut.get_scope(mock_scope_2, generation=1))
 
                     with self.assertRaises(JobException) as e:
                         _ = sut.get_scope(mock_scope_3, generation=-4)
@@ -254,6 +292,10 @@ class TestJobContextImpl(TestCase):
         self.assertEqual("Context has no scope", str(e.exception))
 
         with sut.in_scope(scope):
+            self.assertIsNone(sut._get_state(scope)._teardown)
+            sut.remove_teardown(scope, callback)
+            self.assertIsNone(sut._get_state(scope)._teardown)
+
             sut.add_teardown(scope, callback)
             self.assertEqual([callback], sut._get_state(scope).teardown._callbacks)
 
@@ -314,9 +356,21 @@ class TestJobContextImpl(TestCase):
         sut.status.error(boz_error)
         sut.status.finish_scope(mock_scope)
 
-        self.assertEqual([foo_error, bar_error, baz_error, boz_error, buz_error], sut.get_errors())
-        self.assertEqual([baz_error, boz_error, buz_error], sut.get_errors(mock_scope))
+        self.assertEqual([foo_error, bar_error, baz_error, buz_error, boz_error], sut.get_errors())
+        self.assertEqual([baz_error, buz_error, boz_error], sut.get_errors(mock_scope))
         self.assertEqual([buz_error], sut.get_errors(mock_scope_2))
+        self.assertEqual([], sut.get_errors(MagicMock()))
+        self.assertTrue(sut.has_errors())
+        self.assertTrue(sut.has_errors(mock_scope_2))
+        self.assertFalse(sut.has_errors(MagicMock()))
+        self.assertEqual(JobScopeStatus.FAILED, sut.get_scope_status(mock_scope))
+        self.assertEqual(JobScopeStatus.FAILED, sut.get_scope_status(mock_scope_2))
+
+    def test_has_errors(self) -> None:
+        sut = JobContextImpl()
+        self.assertFalse(sut.has_errors())
+        sut.error("error")
+        self.assertTrue(sut.has_errors())
 
     def test_values(self) -> None:
         sut = JobContextImpl()
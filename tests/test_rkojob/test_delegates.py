@@ -157,6 +157,21 @@ class TestDelegate(TestCase):
 
         self.assertEqual([], sut("value"))
 
+    def test_callbacks_added_during_call(self):
+        sut = Delegate[[str], str]()
+
+        def added(value: str) -> str:
+            return value
+
+        def adding(value: str) -> str:
+            sut.add_callback(added)
+            return value
+
+        sut.add_callback(adding)
+
+        self.assertEqual(["value"], sut("value"))
+        self.assertEqual([adding, added], list(sut))
+
     def test_callback_raises_exception(self):
         sut = Delegate[str, str](continue_on_error=True)
 
@@ -196,6 +211,10 @@ class TestDelegate(TestCase):
         self.assertIs(error, e.exception.__cause__)
         self.assertEqual([error, None], e.exception.results)
 
+    def test_continue_on_error(self) -> None:
+        self.assertFalse(Delegate().continue_on_error)
+        self.assertTrue(Delegate(continue_on_error=True).continue_on_error)
+
     def test_reverse_callback(self):
         sut = Delegate[[str], str](reverse=True)
         side_effects = []
@@ -3,6 +3,7 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
+import sys
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -63,6 +64,30 @@ class TestJobScopeIDMixin(TestCase):
         self.assertNotEqual(bar, baz)
         self.assertNotEqual(hash(bar), hash(baz))
 
+        class Qux:
+            def __init__(self, id):
+                self.id = id
+
+        self.assertEqual(foo, Qux("123"))
+        self.assertNotEqual(foo, Qux("456"))
+
+    def test_interned_id(self) -> None:
+        id: str = "".join(["scope", "-", "id"])
+        self.assertIs(sys.intern("scope-id"), JobStep("step", id=id).id)
+
+    def test_slots(self) -> None:
+        scopes: list[JobScopeIDMixin] = [
+            JobStep("step"),
+            JobStage("stage"),
+            Job("job"),
+            JobStepBuilder("step"),
+            JobStageBuilder("stage"),
+        ]
+        for scope in scopes:
+            with self.subTest(scope=str(scope)):
+                _ = getattr(scope, "teardown")
+                self.assertFalse(hasattr(scope, "__dict__"))
+
 
 class BarAction(JobAction):
     def __init__(self, arg1: str, arg2: int, arg3: float = 1.0, arg4: bool = False) -> None:
@@ -231,6 +256,15 @@ class TestJobStageBuilder(TestCase):
         self.assertEqual("step3", stage.steps[2].name)
         self.assertIs(mock_action3, stage.steps[2].action)
 
+    def test_step_error(self) -> None:
+        sut = JobStageBuilder("stage")
+        with self.assertRaises(ValueError):
+            with sut.step("step1"):
+                raise ValueError("error")
+        with sut.step("step2"):
+            pass
+        self.assertEqual(["step2"], [step.name for step in sut.build().steps])
+
     def test_str(self) -> None:
         self.assertEqual(str(JobStage("name")), str(JobStageBuilder("name")))
 
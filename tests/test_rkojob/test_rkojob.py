@@ -3,6 +3,7 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
+import sys
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -16,6 +17,7 @@ from rkojob import (
     JobStatusCollector,
     ValueKey,
     assign_value,
+    context_has_errors,
     context_value,
     create_scope_id,
     job_action,
@@ -52,6 +54,10 @@ class TestCreateScopeId(TestCase):
         self.assertEqual(36, len(create_scope_id()))
         self.assertNotEqual(create_scope_id(), create_scope_id())
 
+    def test_interned(self) -> None:
+        scope_id: str = create_scope_id()
+        self.assertIs(scope_id, sys.intern("".join(scope_id)))
+
 
 class TestJobBaseStatus(TestCase):
     def test_scope(self) -> None:
@@ -184,6 +190,16 @@ class TestJobStatusCollector(TestCase):
         self.mock_1.detail.assert_called_with(self.mock_arg)
         self.mock_2.detail.assert_called_with(self.mock_arg)
 
+    def test_detail_enabled(self) -> None:
+        self.assertTrue(self.sut.detail_enabled)
+
+        mock_quiet = MagicMock(detail_enabled=False)
+        sut = JobStatusCollector()
+        sut.add_listener(mock_quiet)
+        self.assertFalse(sut.detail_enabled)
+        sut.detail(self.mock_arg)
+        mock_quiet.detail.assert_not_called()
+
     def test_error(self):
         self.sut.error(self.mock_arg)
         self.mock_1.error.assert_called_with(self.mock_arg)
@@ -507,16 +523,25 @@ class TestJobScopeCondition(TestCase):
     def test_job_failing(self) -> None:
         sut = job_failing
         self.assertEqual("Job has failures.", repr(sut))
-        self.assertEqual((True, "Job has failures."), sut(MagicMock(get_errors=MagicMock(return_value=[Exception()]))))
-        self.assertEqual((False, "Job has failures."), sut(MagicMock(get_errors=MagicMock(return_value=[]))))
+        self.assertEqual((True, "Job has failures."), sut(MagicMock(has_errors=MagicMock(return_value=True))))
+        self.assertEqual((False, "Job has failures."), sut(MagicMock(has_errors=MagicMock(return_value=False))))
+
+    def test_context_has_errors_fallback(self) -> None:
+        # Contexts without has_errors() are checked through get_errors().
+        mock_context = MagicMock(spec=["get_errors"])
+        mock_scope = MagicMock()
+        mock_context.get_errors.return_value = [Exception("error")]
+        self.assertTrue(context_has_errors(mock_context, mock_scope))
+        mock_context.get_errors.assert_called_with(mock_scope)
+        mock_context.get_errors.return_value = []
+        self.assertFalse(context_has_errors(mock_context))
+        self.assertEqual((False, "Job has failures."), job_failing(mock_context))
 
     def test_job_succeeding(self) -> None:
         sut = job_succeeding
         self.assertEqual("Job is succeeding.", repr(sut))
-        self.assertEqual(
-            (False, "Job is succeeding."), sut(MagicMock(get_errors=MagicMock(return_value=[Exception()])))
-        )
-        self.assertEqual((True, "Job is succeeding."), sut(MagicMock(get_errors=MagicMock(return_value=[]))))
+        self.assertEqual((False, "Job is succeeding."), sut(MagicMock(has_errors=MagicMock(return_value=True))))
+        self.assertEqual((True, "Job is succeeding."), sut(MagicMock(has_errors=MagicMock(return_value=False))))
 
     def test_scope_failing(self) -> None:
         mock_context = MagicMock()
@@ -526,15 +551,15 @@ class TestJobScopeCondition(TestCase):
         sut = scope_failing(mock_scope)
         self.assertEqual("Scope has failures.", repr(sut))
 
-        mock_context.get_errors.return_value = [Exception()]
+        mock_context.has_errors.return_value = True
         self.assertEqual((True, "Scope has failures."), sut(mock_context))
-        mock_context.get_errors.assert_called_with(mock_scope)
+        mock_context.has_errors.assert_called_with(mock_scope)
 
         mock_context.reset_mock()
-        mock_context.get_errors.return_value = []
+        mock_context.has_errors.return_value = False
 
         self.assertEqual((False, "Scope has failures."), sut(mock_context))
-        mock_context.get_errors.assert_called_with(mock_scope)
+        mock_context.has_errors.assert_called_with(mock_scope)
 
     def test_scope_succeeding(self) -> None:
         mock_context = MagicMock()
@@ -544,15 +569,15 @@ class TestJobScopeCondition(TestCase):
         sut = scope_succeeding(mock_scope)
         self.assertEqual("Scope is succeeding.", repr(sut))
 
-        mock_context.get_errors.return_value = [Exception()]
+        mock_context.has_errors.return_value = True
         self.assertEqual((False, "Scope is succeeding."), sut(mock_context))
-        mock_context.get_errors.assert_called_with(mock_scope)
+        mock_context.has_errors.assert_called_with(mock_scope)
 
         mock_context.reset_mock()
-        mock_context.get_errors.return_value = []
+        mock_context.has_errors.return_value = False
 
         self.assertEqual((True, "Scope is succeeding."), sut(mock_context))
-        mock_context.get_errors.assert_called_with(mock_scope)
+        mock_context.has_errors.assert_called_with(mock_scope)
 
 
 class TestJobContext(TestCase):
@@ -570,7 +595,7 @@ class TestJobAction(TestCase):
         sut = job_action(mock_action)
         self.assertIsInstance(sut, JobAction)
         sut(MagicMock())
-        mock_action.assert_called_once()
+        mock_action.assert_called_once_with()
 
     def test_with_args(self) -> None:
         mock_action = MagicMock()
@@ -605,6 +630,13 @@ class TestLazyAction(TestCase):
         sut.action(MagicMock())  # type: ignore[attr-defined]
         self.assertEqual(["foo", "action"], action_instance.side_effects)
 
+    def test_no_args(self) -> None:
+        sut = lazy_action(FooAction)
+        action_instance = sut._get_action_instance(MagicMock())  # type: ignore[attr-defined]
+        self.assertEqual([], action_instance.side_effects)
+        self.assertIsNone(action_instance.foo)
+        self.assertIs(action_instance, sut._get_action_instance(MagicMock()))  # type: ignore[attr-defined]
+
     def test_values_key(self) -> None:
         values: Values = Values()
         values.set("foo_key", ["foo"])
@@ -3,22 +3,30 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
+import sys
 from enum import Enum, auto
+from typing import Callable
 from unittest import TestCase
+from unittest.mock import MagicMock, call
 
 from rkojob import (
     JobAction,
     JobCallable,
     JobContext,
     JobException,
+    JobScopeKind,
     ValueRef,
     create_scope_id,
+    job_always,
+    job_failing,
+    job_never,
     job_succeeding,
     scope_failing,
     scope_succeeding,
 )
 from rkojob.delegates import Delegate
 from rkojob.factories import JobContextFactory
+from rkojob.job import Job, JobStep
 from rkojob.runner import JobRunnerImpl
 
 
@@ -118,6 +126,44 @@ class TestJobRunnerImpl(TestCase):
             JobRunnerImpl().run(JobContextFactory.create(), StubScope("name", "scope-type"))
         self.assertEqual("Unknown scope type: scope-type", str(e.exception))
 
+    def test_bad_nested_scope(self) -> None:
+        class UnknownScope:
+            def __init__(self, name, type):
+                self.name = name
+                self.type = type
+
+        side_effects: list[str] = []
+        stage = StubGroupScope("stage", StubScopeType.STAGE, [UnknownScope("name", "scope-type")])
+        stage.teardown += lambda _: side_effects.append("Teardown stage")
+        job = StubGroupScope("job", StubScopeType.JOB, [stage])
+        job.teardown += lambda _: side_effects.append("Teardown job")
+
+        context: JobContext = JobContextFactory.create()
+        with self.assertRaises(JobException) as e:
+            JobRunnerImpl().run(context, job)
+        self.assertEqual("Unknown scope type: scope-type", str(e.exception))
+        # Open scopes are torn down and exited innermost first.
+        self.assertEqual(["Teardown stage", "Teardown job"], side_effects)
+        self.assertEqual((), context.scopes)
+
+    def test_deeply_nested(self) -> None:
+        # Scopes are run from an explicit stack, so nesting isn't limited by the recursion limit.
+        depth: int = sys.getrecursionlimit() + 100
+        side_effects: list[str] = []
+
+        def teardown(name: str) -> Callable[[JobContext], None]:
+            return lambda _: side_effects.append(f"Teardown {name}")
+
+        scope: StubScope = StubActionScope("step", StubScopeType.STEP, action=lambda _: side_effects.append("Action"))
+        for level in range(depth):
+            scope = StubGroupScope(f"stage{level}", StubScopeType.STAGE, [scope], teardown=teardown(f"stage{level}"))
+
+        context: JobContext = JobContextFactory.create()
+        JobRunnerImpl().run(context, scope)
+
+        self.assertEqual(["Action"] + [f"Teardown stage{level}" for level in range(depth)], side_effects)
+        self.assertEqual((), context.scopes)
+
     def test_action_method_as_teardown(self) -> None:
         class SomeAction(JobAction):
             def __init__(self, side_effects: list[str]) -> None:
@@ -473,3 +519,94 @@ class TestJobRunnerImpl(TestCase):
         sut = JobRunnerImpl()
         step = StubActionScope("step", 3, skip_if=True)
         self.assertEqual((True, ""), sut._should_skip(context, step))
+
+    def test_scope_kind(self) -> None:
+        sut = JobRunnerImpl()
+        self.assertEqual(
+            JobScopeKind.ACTION | JobScopeKind.TEARDOWN | JobScopeKind.CONDITIONAL,
+            sut._scope_kind(StubActionScope("step", StubScopeType.STEP)),
+        )
+        self.assertEqual(
+            JobScopeKind.GROUP | JobScopeKind.TEARDOWN,
+            sut._scope_kind(StubGroupScope("stage", StubScopeType.STAGE, [])),
+        )
+        self.assertEqual(JobScopeKind.TEARDOWN, sut._scope_kind(StubScope("scope", StubScopeType.STEP)))
+
+    def test_scope_kind_cached(self) -> None:
+        sut = JobRunnerImpl()
+        scope = StubActionScope("step", StubScopeType.STEP)
+        kind: int = sut._scope_kind(scope)
+        self.assertEqual({StubActionScope: kind}, sut._scope_kinds)
+        # Cached kinds are used for later scopes of the same class.
+        sut._scope_kinds[StubActionScope] = JobScopeKind.ACTION
+        self.assertEqual(JobScopeKind.ACTION, sut._scope_kind(StubActionScope("step", StubScopeType.STEP)))
+
+    def test_scope_kind_declared(self) -> None:
+        class DeclaredScope(StubScope):
+            _scope_kind = JobScopeKind.ACTION
+
+        sut = JobRunnerImpl()
+        self.assertEqual(JobScopeKind.ACTION, sut._scope_kind(DeclaredScope("scope", StubScopeType.STEP)))
+        self.assertEqual(JobScopeKind.GROUP | JobScopeKind.TEARDOWN, sut._scope_kind(Job("job")))
+        self.assertEqual(
+            JobScopeKind.ACTION | JobScopeKind.TEARDOWN | JobScopeKind.CONDITIONAL, sut._scope_kind(JobStep("step"))
+        )
+
+    def test_resolve_conditional_built_in(self) -> None:
+        context: JobContext = JobContextFactory.create()
+        sut = JobRunnerImpl()
+        self.assertEqual((False, "Never"), sut._resolve_conditional(context, job_never))
+        self.assertEqual((True, "Always"), sut._resolve_conditional(context, job_always))
+        self.assertEqual((False, "Job has failures."), sut._resolve_conditional(context, job_failing))
+        self.assertEqual((False, "Never"), sut._should_skip(context, StubScope("scope", StubScopeType.STEP)))
+
+    def test_teardown_warnings(self) -> None:
+        error_1 = Exception("error 1")
+        error_2 = Exception("error 2")
+
+        def failing(context: JobContext) -> None:
+            raise error_1
+
+        def nested_failing(context: JobContext) -> None:
+            raise error_2
+
+        nested: Delegate[[JobContext], None] = Delegate(continue_on_error=True)
+        nested += nested_failing
+
+        scope = StubActionScope("scope", StubScopeType.STEP)
+        scope.teardown += failing
+        scope.teardown += nested.__call__
+        scope.teardown += lambda _: "not an error"
+
+        status_writer = MagicMock()
+        JobRunnerImpl().run(JobContextFactory.create(status_writer=status_writer), scope)
+        self.assertEqual([call(error_1), call(error_2)], status_writer.warning.call_args_list)
+
+    def test_teardown_stops_on_error(self) -> None:
+        error = Exception("error")
+        side_effects: list[str] = []
+
+        def failing(context: JobContext) -> None:
+            raise error
+
+        scope = StubActionScope("scope", StubScopeType.STEP)
+        scope.teardown = Delegate[[JobContext], None]()
+        scope.teardown += failing
+        scope.teardown += lambda _: side_effects.append("teardown")
+
+        status_writer = MagicMock()
+        JobRunnerImpl().run(JobContextFactory.create(status_writer=status_writer), scope)
+        # Teardowns are always run to completion, even when the scope's delegate would stop on error.
+        self.assertEqual(["teardown"], side_effects)
+        status_writer.warning.assert_called_once_with(error)
+
+    def test_skipping_teardown_detail(self) -> None:
+        scope = StubActionScope("scope", StubScopeType.STEP)
+
+        status_writer = MagicMock()
+        JobRunnerImpl().run(JobContextFactory.create(status_writer=status_writer), scope)
+        status_writer.detail.assert_called_once_with(f"Skipping Teardown {scope}")
+
+        status_writer = MagicMock(detail_enabled=False)
+        JobRunnerImpl().run(JobContextFactory.create(status_writer=status_writer), scope)
+        status_writer.detail.assert_not_called()
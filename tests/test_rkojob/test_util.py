@@ -3,10 +3,15 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
+import copy
+import os
+import sys
+from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import Any, BinaryIO
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from rkojob.util import (
     Shell,
@@ -14,6 +19,7 @@ from rkojob.util import (
     ShellResult,
     ToolBuilder,
     ToolRunner,
+    _read_chunks,
     deep_flatten,
     to_camel,
     to_kebab,
@@ -29,6 +35,15 @@ class TestShellException(TestCase):
 
 
 class TestShell(TestCase):
+    def pipe(self, lines: list[str]) -> BinaryIO:
+        # A pipe that has been written to and closed, for the selector to read from.
+        read_fd, write_fd = os.pipe()
+        with open(write_fd, "wb") as writer:
+            writer.write("".join(lines).encode())
+        reader: BinaryIO = open(read_fd, "rb")
+        self.addCleanup(reader.close)
+        return reader
+
     def mock_popen(self, return_code: int = 0, stdout: list[str] | None = None, stderr: list[str] | None = None):
         if stdout is None:
             stdout = []
@@ -36,8 +51,8 @@ class TestShell(TestCase):
             stderr = []
         mock_proc: MagicMock = MagicMock()
         mock_proc.returncode = return_code
-        mock_proc.stdout = stdout
-        mock_proc.stderr = stderr
+        mock_proc.stdout = self.pipe(stdout)
+        mock_proc.stderr = self.pipe(stderr)
         return MagicMock(return_value=mock_proc)
 
     def test(self) -> None:
@@ -47,7 +62,7 @@ class TestShell(TestCase):
         result: ShellResult = sut("greet", "Hello, world!")
 
         sut._popen.assert_called_with(
-            ("greet", "Hello, world!"), stdout=-1, stderr=-1, text=True, cwd=None, env=None, shell=False
+            ("greet", "Hello, world!"), stdout=-1, stderr=-1, cwd=None, env=None, shell=False
         ),
 
         self.assertEqual("Hello, world!\n", result.stdout)
@@ -63,7 +78,7 @@ class TestShell(TestCase):
         result = e.exception.result
 
         sut._popen.assert_called_with(
-            ("greet", "Hello, world!"), stdout=-1, stderr=-1, text=True, cwd=None, env=None, shell=False
+            ("greet", "Hello, world!"), stdout=-1, stderr=-1, cwd=None, env=None, shell=False
         ),
 
         self.assertEqual("", result.stdout)
@@ -77,28 +92,38 @@ class TestShell(TestCase):
         result = sut("greet", "Hello, world!")
 
         sut._popen.assert_called_with(
-            ("greet", "Hello, world!"), stdout=-1, stderr=-1, text=True, cwd=None, env=None, shell=False
+            ("greet", "Hello, world!"), stdout=-1, stderr=-1, cwd=None, env=None, shell=False
         ),
 
         self.assertEqual("", result.stdout)
         self.assertEqual("error\n", result.stderr)
         self.assertEqual(1, result.return_code)
 
+    def test_no_capture(self) -> None:
+        sut = Shell(capture_stdout=False, show_stdout=False, show_stderr=False)
+        sut._popen = self.mock_popen(stdout=["Hello, world!\n"], stderr=["Secret hello!\n"])
+        result: ShellResult = sut("greet")
+        self.assertEqual("", result.stdout)
+        self.assertEqual("Secret hello!\n", result.stderr)
+
+        sut._popen = self.mock_popen(stdout=["Hello, world!\n"], stderr=["Secret hello!\n"])
+        result = sut("greet", capture_stdout=True, capture_stderr=False)
+        self.assertEqual("Hello, world!\n", result.stdout)
+        self.assertEqual("", result.stderr)
+
     def test_show_redirect_stderr(self) -> None:
         sut = Shell()
         sut._popen = self.mock_popen()
         sut("greet", "Hello, world!", stderr_to_stdout=True)
         sut._popen.assert_called_with(
-            ("greet", "Hello, world!"), stdout=-1, stderr=-2, text=True, cwd=None, env=None, shell=False
+            ("greet", "Hello, world!"), stdout=-1, stderr=-2, cwd=None, env=None, shell=False
         ),
 
     def test_tee_stderr(self) -> None:
         sut = Shell()
         sut._popen = self.mock_popen(stdout=["Hello, world!\n"], stderr=["Secret hello!\n"])
         sut("greet", "Hello, world!", tee_stderr="/dev/null")
-        sut._popen.assert_called_with(
-            ("greet", "Hello, world!"), stdout=-1, stderr=-1, text=True, cwd=None, env=None, shell=False
-        )
+        sut._popen.assert_called_with(("greet", "Hello, world!"), stdout=-1, stderr=-1, cwd=None, env=None, shell=False)
 
     def test_tee_stdout(self) -> None:
         with NamedTemporaryFile(mode="wt+") as temp_file:
@@ -106,17 +131,24 @@ class TestShell(TestCase):
             sut._popen = self.mock_popen(stdout=["Hello, world!\n"], stderr=["Secret hello!\n"])
             sut("greet", "Hello, world!", tee_stdout=temp_file.file)
             sut._popen.assert_called_with(
-                ("greet", "Hello, world!"), stdout=-1, stderr=-1, text=True, cwd=None, env=None, shell=False
+                ("greet", "Hello, world!"), stdout=-1, stderr=-1, cwd=None, env=None, shell=False
             )
             self.assertEqual("Hello, world!\n", Path(temp_file.name).read_text())
 
+    def test_tee_stderr_file(self) -> None:
+        with NamedTemporaryFile(mode="wt+") as temp_file:
+            sut = Shell()
+            sut._popen = self.mock_popen(stdout=["Hello, world!\n"], stderr=["Secret hello!\n"])
+            sut("greet", "Hello, world!", tee_stderr=temp_file.file)
+            self.assertEqual("Secret hello!\n", Path(temp_file.name).read_text())
+
     def test_tee_stdout_and_stderr_same(self) -> None:
         with NamedTemporaryFile(mode="wt+") as temp_file:
             sut = Shell()
             sut._popen = self.mock_popen(stdout=["Hello, world!\n"], stderr=["Secret hello!\n"])
             sut("greet", "Hello, world!", tee_stdout=temp_file.name, tee_stderr=temp_file.name)
             sut._popen.assert_called_with(
-                ("greet", "Hello, world!"), stdout=-1, stderr=-1, text=True, cwd=None, env=None, shell=False
+                ("greet", "Hello, world!"), stdout=-1, stderr=-1, cwd=None, env=None, shell=False
             )
             self.assertEqual("Hello, world!\nSecret hello!\n", Path(temp_file.name).read_text())
 
@@ -125,6 +157,59 @@ class TestShell(TestCase):
         result: ShellResult = sut("echo", "Hello, world!")
         self.assertEqual("Hello, world!\n", result.stdout)
 
+    def test_real_interleaved(self) -> None:
+        # More output than a pipe can hold is written to stderr before anything is written to stdout.
+        sut = Shell(show_stdout=False, show_stderr=False)
+        result: ShellResult = sut(
+            sys.executable, "-c", "import sys; sys.stderr.write('e' * 1000000); sys.stdout.write('done')"
+        )
+        self.assertEqual("done", result.stdout)
+        self.assertEqual(1000000, len(result.stderr))
+
+    @patch("rkojob.util._SELECTABLE_PIPES", False)
+    def test_real_shared_tee_threads(self) -> None:
+        tee = StringIO()
+        sut = Shell(show_stdout=False, show_stderr=False, tee_stdout=tee, tee_stderr=tee)
+        result: ShellResult = sut(
+            sys.executable, "-c", "import sys; sys.stderr.write('e' * 100000); sys.stdout.write('o' * 100000)"
+        )
+        self.assertEqual(100000, len(result.stdout))
+        self.assertEqual(100000, len(result.stderr))
+        self.assertEqual(100000, tee.getvalue().count("e"))
+        self.assertEqual(100000, tee.getvalue().count("o"))
+
+    @patch("rkojob.util._SELECTABLE_PIPES", False)
+    def test_real_thread_error(self) -> None:
+        # An error while draining stderr on a worker thread is raised from the call.
+        class FailingTee(StringIO):
+            def write(self, s: str) -> int:
+                raise OSError("disk full")
+
+        sut = Shell(show_stdout=False, show_stderr=False, tee_stderr=FailingTee())
+        with self.assertRaises(OSError) as e:
+            sut(sys.executable, "-c", "import sys; sys.stderr.write('error'); sys.stdout.write('done')")
+        self.assertEqual("disk full", str(e.exception))
+
+    @patch("rkojob.util._SELECTABLE_PIPES", False)
+    def test_real_interleaved_threads(self) -> None:
+        # Pipes are drained on threads where they can't be selected (Windows).
+        sut = Shell(show_stdout=False, show_stderr=False)
+        result: ShellResult = sut(
+            sys.executable, "-c", "import sys; sys.stderr.write('e' * 1000000); sys.stdout.write('done')"
+        )
+        self.assertEqual("done", result.stdout)
+        self.assertEqual(1000000, len(result.stderr))
+
+
+class TestReadChunks(TestCase):
+    def test(self) -> None:
+        stream = MagicMock()
+        stream.read1.side_effect = [b"caf\xc3", b"\xa9\r", b"\nline 2\rline 3\n", b"\xff", b""]
+        self.assertEqual(["caf", "\u00e9", "\nline 2\nline 3\n", "\ufffd", ""], list(_read_chunks(stream, "utf-8")))
+
+    def test_empty(self) -> None:
+        self.assertEqual([""], list(_read_chunks(BytesIO(), "utf-8")))
+
 
 class TestToCamel(TestCase):
     def test_kebab_to_camel(self):
@@ -171,6 +256,19 @@ class TestToKebab(TestCase):
         self.assertEqual(to_kebab("Tool"), "tool")
         self.assertEqual(to_kebab("tool"), "tool")
 
+    def test_lowercase(self):
+        self.assertEqual(to_kebab("depth"), "depth")
+        self.assertEqual(to_kebab("no_color"), "no-color")
+        self.assertEqual(to_kebab("no__color--x"), "no-color-x")
+
+    def test_digits_and_edges(self):
+        self.assertEqual(to_kebab(""), "")
+        self.assertEqual(to_kebab("A"), "a")
+        self.assertEqual(to_kebab("version2Name"), "version2-name")
+        self.assertEqual(to_kebab("HTTP2Server"), "http2-server")
+        self.assertEqual(to_kebab("ABCdef"), "ab-cdef")
+        self.assertEqual(to_kebab("_Private"), "-private")
+
 
 class TestToolBuilder(TestCase):
     def test_commands(self) -> None:
@@ -178,6 +276,16 @@ class TestToolBuilder(TestCase):
         self.assertEqual(["command"], sut._commands)
         self.assertEqual(["command", "sub_command"], sut.sub_command._commands)
 
+    def test_children_cached(self) -> None:
+        sut = ToolBuilder("command")
+        self.assertIs(sut.sub_command, sut.sub_command)
+        self.assertIsNot(sut.sub_command, sut.other_command)
+
+    def test_private_names(self) -> None:
+        with self.assertRaises(AttributeError):
+            _ = ToolBuilder("command")._sub_command
+        self.assertEqual(["command"], copy.deepcopy(ToolBuilder("command"))._commands)
+
     def test_prepare(self) -> None:
         runner: ToolRunner = ToolBuilder().command.sub_command.prepare(
             "arg1", "--arg2", "value2", arg3="value3", arg_4=1234
@@ -206,6 +314,26 @@ class TestToolRunner(TestCase):
             "command", "sub-command", "arg1", "--arg2", "value2", "--arg3", "value3", "--arg-4", 1234
         )
 
+    def test_command_built_once(self) -> None:
+        # The command line is built from the construction arguments once; callers get a copy each time.
+        sut: ToolRunner = ToolRunner(["command"], "arg", option="value", shell=MagicMock())
+        command: list[Any] = sut.command
+        self.assertEqual(["command", "arg", "--option", "value"], command)
+        command.append("changed")
+        sut._args.append("ignored")
+        self.assertEqual(["command", "arg", "--option", "value"], sut.command)
+
+    def test_command_override(self) -> None:
+        class DryRunner(ToolRunner):
+            @property
+            def command(self) -> list[Any]:
+                return ["echo"] + super().command
+
+        mock_shell = MagicMock()
+        sut = ToolBuilder("tool", shell=mock_shell).prepare("arg", runner_type=DryRunner)
+        sut()
+        mock_shell.assert_called_once_with("echo", "tool", "arg")
+
     def test_fixup_commands(self) -> None:
         self.assertEqual(
             ["part1", "part-2", "part-three"], ToolRunner._fixup_commands(["part1", "part_2", "part-three"])
@@ -217,6 +345,12 @@ class TestToolRunner(TestCase):
             ToolRunner._fixup_args(["arg1", "--arg2", None, "arg3", True, 123, ["a", 1, (True, False)]]),
         )
 
+    def test_fixup_args_deeply_nested(self) -> None:
+        args: list[Any] = ["arg"]
+        for _ in range(sys.getrecursionlimit() * 2):
+            args = [args, None]
+        self.assertEqual(["arg"], ToolRunner._fixup_args(args))
+
     def test_fixup_kwargs(self) -> None:
         self.assertEqual(
             ["--arg-one", "one", "--arg_2", "two", "-a", "--a-list", "a", "b", "c"],
@@ -3,6 +3,7 @@
 # This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
+import sys
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -17,8 +18,10 @@ from rkojob.values import (
     ValueKey,
     ValueRef,
     Values,
+    ValuesRef,
     as_value_ref,
     get_ref_value,
+    is_value_provider,
 )
 
 
@@ -114,6 +117,25 @@ class TestMappedValueProvider(TestCase):
     def test_map(self) -> None:
         self.assertEqual("FOO", ValueRef("foo").map(lambda x: str(x).upper()).value)
 
+    def test_nested(self) -> None:
+        ref: ValueRef[str] = ValueRef()
+        sut = MappedValueProvider(len, MappedValueProvider(lambda x: str(x) * 2, ref))
+        self.assertIs(ref, sut._provider)
+        self.assertFalse(sut.has_value)
+        ref.value = "foo"
+        self.assertEqual(6, sut.get())
+
+    def test_nested_subclass_not_fused(self) -> None:
+        class Upper(MappedValueProvider[str]):
+            def get(self) -> str:
+                return super().get().upper()
+
+        ref: ValueRef[str] = ValueRef("foo")
+        inner = Upper(str, ref)
+        sut = MappedValueProvider(lambda x: f"<{x}>", inner)
+        self.assertIs(inner, sut._provider)
+        self.assertEqual("<FOO>", sut.get())
+
 
 class TestComputedValue(TestCase):
     def test_value(self) -> None:
@@ -190,6 +212,24 @@ class TestGetRefValue(TestCase):
         self.assertEqual("default", get_ref_value(ValueRef(), default="default"))
 
 
+class TestIsValueProvider(TestCase):
+    def test_is_value_provider(self) -> None:
+        class Provider:
+            def get(self) -> str:
+                return "value"
+
+            @property
+            def has_value(self) -> bool:
+                return True
+
+        self.assertTrue(is_value_provider(ValueRef()))
+        self.assertTrue(is_value_provider(ComputedValue(lambda: "value")))
+        self.assertTrue(is_value_provider(Provider()))
+        self.assertFalse(is_value_provider("value"))
+        self.assertFalse(is_value_provider(None))
+        self.assertFalse(is_value_provider(object()))
+
+
 class TestValues(TestCase):
     def test_has_value(self) -> None:
         sut = Values(int_ref=123, str_ref="abc")
@@ -267,6 +307,14 @@ class TestValues(TestCase):
             _ = int_ref.get()
         self.assertEqual("Values has no value associated with key 'int_ref'", str(e.exception))
 
+    def test_interned_keys(self) -> None:
+        name: str = "".join(["int", "_", "ref"])
+        self.assertIs(sys.intern("int_ref"), ValueKey[int](name).name)
+
+        sut = Values()
+        sut.set("".join(["str", "_", "ref"]), "abc")
+        self.assertIs(sys.intern("str_ref"), next(iter(sut.keys())))
+
     def test_keys(self) -> None:
         sut = Values(int_prop=123, str_prop="abc")
         self.assertEqual({"int_prop", "str_prop"}, sut.keys())
@@ -277,6 +325,18 @@ class TestValues(TestCase):
         sut.unset("str_prop")
         self.assertEqual(set(), sut.keys())
 
+    def test_keys_view(self) -> None:
+        sut = Values(int_prop=123)
+        keys = sut.keys()
+        sut.set("str_prop", "abc")
+        self.assertIn("str_prop", keys)
+
+    def test_snapshot_keys(self) -> None:
+        sut = Values(int_prop=123)
+        keys: set[str] = sut.snapshot_keys()
+        sut.set("str_prop", "abc")
+        self.assertEqual({"int_prop"}, keys)
+
     def test_get_nested_key_and_dict(self) -> None:
         sut = Values(root={"a": {"b": "c"}})
         self.assertEqual(("b", {"b": "c"}), sut._get_nested_key_and_dict("root.a.b"))
@@ -293,6 +353,30 @@ class TestValues(TestCase):
         self.assertEqual({"b": "c"}, sut.get("root.a"))
         self.assertEqual("c", sut.get("root.a.b"))
 
+    def test_get_nested_no_value(self) -> None:
+        with self.assertRaises(NoValueError) as e:
+            _ = Values(root={"a": "b"}).get("root.z")
+        self.assertEqual("Values has no value associated with key 'root.z'", str(e.exception))
+
+    def test_get_ref_nested(self) -> None:
+        sut = Values(root={"a": "b"})
+        ref: ValueRef[str] = sut.get_ref("root.a")
+        self.assertEqual("b", ref.get())
+        ref.set("c")
+        self.assertEqual({"root": {"a": "c"}}, sut._values)
+        ref.unset()
+        self.assertFalse(ref.has_value)
+        self.assertEqual({"root": {}}, sut._values)
+
+    def test_unset_missing(self) -> None:
+        sut = Values(root="a")
+        sut.unset("other")
+        sut.unset("root.a")
+        self.assertEqual({"root": "a"}, sut._values)
+
+        sut.unset("other.a.b")
+        self.assertEqual({"root": "a"}, sut._values)
+
     def test_has_value_nested(self) -> None:
         sut = Values(root={"a": {"b": "c"}})
         self.assertTrue(sut.has_value("root"))
@@ -318,27 +402,23 @@ class TestValues(TestCase):
 
 
 class TestEnvironmentVariable(TestCase):
-    @patch("rkojob.values.os.getenv")
-    def test_get(self, mock_getenv) -> None:
-        mock_getenv.return_value = "123"
+    @patch.dict("rkojob.values.os.environ", {"int_ref": "123"})
+    def test_get(self) -> None:
         self.assertEqual(123, EnvironmentVariable("int_ref", int).get())
 
-    @patch("rkojob.values.os.getenv")
-    def test_has_value(self, mock_getenv) -> None:
-        mock_getenv.return_value = "TRUE"
+    @patch.dict("rkojob.values.os.environ", {"int_ref": "TRUE"})
+    def test_has_value(self) -> None:
         self.assertTrue(EnvironmentVariable("int_ref", bool).has_value)
 
-    @patch("rkojob.values.os.getenv")
-    def test_has_value_no_value(self, mock_getenv) -> None:
-        mock_getenv.return_value = NoValue
+    @patch.dict("rkojob.values.os.environ", clear=True)
+    def test_has_value_no_value(self) -> None:
         self.assertFalse(EnvironmentVariable("int_ref", bool).has_value)
 
     def test_has_value_default(self) -> None:
         self.assertTrue(EnvironmentVariable("Lets_Hope_This_Is_Not_Set_rkojob", as_str, default="default").has_value)
 
-    @patch("rkojob.values.os.getenv")
-    def test_get_no_value(self, mock_getenv) -> None:
-        mock_getenv.return_value = NoValue
+    @patch.dict("rkojob.values.os.environ", clear=True)
+    def test_get_no_value(self) -> None:
         with self.assertRaises(NoValueError) as e:
             _ = EnvironmentVariable("path_ref", str).get()
         self.assertEqual("Environment variable 'path_ref' is not set.", str(e.exception))
@@ -356,3 +436,21 @@ class TestEnvironmentVariable(TestCase):
             "environment_variable('key', as_bool, default=True)",
             repr(EnvironmentVariable("key", as_bool, default=True)),
         )
+
+
+class TestSlots(TestCase):
+    def test_no_dict(self) -> None:
+        values: Values = Values()
+        instances: list = [
+            ValueRef("value"),
+            MappedValueProvider(str),
+            ComputedValue(lambda: "value"),
+            LazyValue(lambda: "value"),
+            EnvironmentVariable("NAME", as_str),
+            ValueKey[str]("key"),
+            ValuesRef(values, ValueKey[str]("key")),
+            values,
+        ]
+        for instance in instances:
+            with self.subTest(instance=instance.__class__.__name__):
+                self.assertFalse(hasattr(instance, "__dict__"))
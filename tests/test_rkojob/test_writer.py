@@ -5,15 +5,18 @@
 
 from datetime import timedelta
 from io import StringIO
+from itertools import count
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from rkojob import JobException
 from rkojob.writer import (
+    BufferedStatusSink,
     ErrorEvent,
     ItemFinishErrorEvent,
     ItemFinishErrorsEvent,
     ItemFinishEvent,
+    ItemStartEvent,
     JobStatusWriter,
     JobStatusWriterEvent,
     OutputEvent,
@@ -24,9 +27,14 @@ from rkojob.writer import (
     SectionFinishErrorEvent,
     SectionFinishErrorsEvent,
     SectionFinishEvent,
+    SectionStartEvent,
 )
 
 
+def _ns(duration: timedelta) -> int:
+    return duration // timedelta(microseconds=1) * 1000
+
+
 class StubScope:
     def __init__(self, name, type, id=None):
         self.name = name
@@ -34,6 +42,31 @@ class StubScope:
         self.id = id or name
 
 
+class TestJobStatusWriterEvent(TestCase):
+    def test_slots(self) -> None:
+        for event in (
+            ScopeFinishErrorEvent(StubScope("name", "type"), "error"),
+            ScopeFinishErrorsEvent(StubScope("name", "type"), ["error"]),
+            OutputEvent("output", label="label"),
+            ItemFinishEvent(),
+        ):
+            with self.subTest(event=type(event).__name__):
+                self.assertFalse(hasattr(event, "__dict__"))
+
+
+class TestStartEvents(TestCase):
+    def test_no_duration(self) -> None:
+        for event in (
+            ScopeStartEvent(StubScope("name", "type")),
+            SectionStartEvent("name"),
+            ItemStartEvent("name"),
+        ):
+            with self.subTest(event=type(event).__name__):
+                stream: StringIO = StringIO()
+                event.write_event(stream, duration_ns=1_000_000_000)
+                self.assertNotIn("(1.000s)", stream.getvalue())
+
+
 class TestOutputEvent(TestCase):
     def test_collapsible(self) -> None:
         stream: StringIO = StringIO()
@@ -61,8 +94,75 @@ class TestOutputEvent(TestCase):
             stream.getvalue(),
         )
 
+    def test_no_output(self) -> None:
+        stream: StringIO = StringIO()
+        sut = OutputEvent([], label="label")
+        sut.write_event(stream)
+        self.assertEqual("label:\n\n\n", stream.getvalue())
+
+    def test_single_write(self) -> None:
+        stream = MagicMock()
+        sut = OutputEvent(["this\nis", "output\n"], label="label", collapsible=True)
+        sut.write_event(stream)
+        stream.write.assert_called_once_with(
+            "<details>\n"
+            "<summary>label</summary>\n"
+            "\n"
+            "    this\n"
+            "    is\n"
+            "    output\n"
+            "\n"
+            "</details>\n"
+            "\n"
+        )
+
+
+class TestBufferedStatusSink(TestCase):
+    def test_write(self) -> None:
+        stream: StringIO = StringIO()
+        sut = BufferedStatusSink(stream, start_batching_after=2, flush_chars=6)
+        self.assertTrue(sut.writable())
+
+        self.assertEqual(1, sut.write("a"))
+        self.assertEqual(1, sut.write("b"))
+        self.assertEqual("ab", stream.getvalue())
+
+        self.assertEqual(3, sut.write("cde"))
+        self.assertEqual("ab", stream.getvalue())
+        self.assertEqual(3, sut.write("fgh"))
+        self.assertEqual("abcdefgh", stream.getvalue())
+
+        sut.write("i")
+        self.assertEqual("abcdefgh", stream.getvalue())
+        sut.flush()
+        self.assertEqual("abcdefghi", stream.getvalue())
+
+        sut.write("j")
+        self.assertEqual("abcdefghij", stream.getvalue())
+
+    def test_close(self) -> None:
+        stream = MagicMock()
+        sut = BufferedStatusSink(stream, start_batching_after=0)
+        sut.write("a")
+        stream.write.assert_not_called()
+        sut.close()
+        stream.write.assert_called_once_with("a")
+        stream.close.assert_not_called()
+
 
 class TestJobStatusWriter(TestCase):
+    def test_buffered(self) -> None:
+        stream = MagicMock()
+        sut = JobStatusWriter(stream, buffered=True)
+        sut.start_scope(StubScope("name", "type"), include_duration=False)
+        for index in range(5):
+            sut.info(f"info{index}")
+        self.assertEqual(4, stream.write.call_count)
+
+        sut.finish_scope()
+        self.assertEqual(5, stream.write.call_count)
+        self.assertEqual("info3\n\ninfo4\n\n✅ Finished **type name**\n\n", stream.write.call_args.args[0])
+
     def test_depth(self) -> None:
         sut: JobStatusWriter = JobStatusWriter(MagicMock())
         self.assertEqual(0, sut._depth(ScopeFinishEvent))
@@ -276,7 +376,8 @@ class TestJobStatusWriter(TestCase):
         self.assertEqual(["error1"], sut._get_errors(ScopeFinishEvent, include_children=False))
         sut.finish_scope()
 
-    def test_start_finish_scope(self) -> None:
+    @patch("rkojob.writer.monotonic_ns", side_effect=count(0, 1000))
+    def test_start_finish_scope(self, _: MagicMock) -> None:
         stream: StringIO = StringIO()
         sut = JobStatusWriter(stream=stream)
 
@@ -311,7 +412,8 @@ class TestJobStatusWriter(TestCase):
         sut.skip_scope(StubScope("name", "type"), "Disabled")
         self.assertEqual("**Skipping type name (Disabled)**\n\n", stream.getvalue())
 
-    def test_start_finish_section(self) -> None:
+    @patch("rkojob.writer.monotonic_ns", side_effect=count(0, 1000))
+    def test_start_finish_section(self, _: MagicMock) -> None:
         stream: StringIO = StringIO()
         sut = JobStatusWriter(stream=stream)
 
@@ -331,7 +433,8 @@ class TestJobStatusWriter(TestCase):
             stream.getvalue(),
         )
 
-    def test_start_finish_item(self) -> None:
+    @patch("rkojob.writer.monotonic_ns", side_effect=count(0, 1000))
+    def test_start_finish_item(self, _: MagicMock) -> None:
         stream: StringIO = StringIO()
         sut = JobStatusWriter(stream=stream)
         sut.start_item("foo")
@@ -396,15 +499,19 @@ class TestJobStatusWriter(TestCase):
         )
 
     def test_duration_format(self) -> None:
-        self.assertEqual("0s", JobStatusWriterEvent._format_duration(timedelta()))
-        self.assertEqual("1.000s", JobStatusWriterEvent._format_duration(timedelta(seconds=1)))
-        self.assertEqual("5s", JobStatusWriterEvent._format_duration(timedelta(seconds=5, milliseconds=1)))
-        self.assertEqual("0.001s", JobStatusWriterEvent._format_duration(timedelta(milliseconds=1)))
-        self.assertEqual("1.001s", JobStatusWriterEvent._format_duration(timedelta(seconds=1, milliseconds=1)))
-        self.assertEqual("4m1s", JobStatusWriterEvent._format_duration(timedelta(minutes=4, seconds=1, milliseconds=1)))
+        self.assertEqual("0s", JobStatusWriterEvent._format_duration(_ns(timedelta())))
+        self.assertEqual("1.000s", JobStatusWriterEvent._format_duration(_ns(timedelta(seconds=1))))
+        self.assertEqual("5s", JobStatusWriterEvent._format_duration(_ns(timedelta(seconds=5, milliseconds=1))))
+        self.assertEqual("0.001s", JobStatusWriterEvent._format_duration(_ns(timedelta(milliseconds=1))))
+        self.assertEqual("1.001s", JobStatusWriterEvent._format_duration(_ns(timedelta(seconds=1, milliseconds=1))))
+        self.assertEqual(
+            "4m1s", JobStatusWriterEvent._format_duration(_ns(timedelta(minutes=4, seconds=1, milliseconds=1)))
+        )
         self.assertEqual(
             "26h3m",
-            JobStatusWriterEvent._format_duration(timedelta(days=1, hours=2, minutes=3, seconds=4, milliseconds=5)),
+            JobStatusWriterEvent._format_duration(
+                _ns(timedelta(days=1, hours=2, minutes=3, seconds=4, milliseconds=5))
+            ),
         )
 
     def test_info(self) -> None:
@@ -425,6 +532,10 @@ class TestJobStatusWriter(TestCase):
         sut.detail("detail")
         self.assertEqual("", stream.getvalue())
 
+    def test_detail_enabled(self) -> None:
+        self.assertTrue(JobStatusWriter(StringIO()).detail_enabled)
+        self.assertFalse(JobStatusWriter(StringIO(), show_detail=False).detail_enabled)
+
     def test_warning(self) -> None:
         stream: StringIO = StringIO()
         sut = JobStatusWriter(stream=stream)
@@ -437,7 +548,8 @@ class TestJobStatusWriter(TestCase):
         sut.error("error")
         self.assertEqual("❌ error\n\n", stream.getvalue())
 
-    def test_output(self) -> None:
+    @patch("rkojob.writer.monotonic_ns", side_effect=count(0, 1000))
+    def test_output(self, _: MagicMock) -> None:
         stream: StringIO = StringIO()
         sut = JobStatusWriter(stream=stream)
         sut.start_section("Some code")